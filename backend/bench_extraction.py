@@ -0,0 +1,150 @@
+"""Micro-benchmarks des étapes CPU de l'extraction (à lancer à la main).
+
+    python bench_extraction.py scanner
+    python bench_extraction.py links --corpus pages_sauvegardees/
+    python bench_extraction.py linkedin_urls --corpus pages_linkedin/
+"""
+import argparse
+import glob
+import os
+import re
+import time
+
+from contact_scanner import EMAIL_REGEX, PHONE_REGEX, scan_contacts
+from link_extractor import _anchors_fast, _anchors_soup
+from linkedin_company import rank_external_urls
+
+IMAGE_SUFFIXES = ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp')
+
+def make_page(size, contacts_at_end=True):
+    """Page HTML synthétique d'environ `size` octets : balisage, images @2x, blobs base64, contacts en fin."""
+    block = (
+        '<div class="card"><img src="/img/logo@2x.png" alt="logo"><a href="/produits/coupe-homme">Coupe homme</a>'
+        '<span data-v="AbCdEfGhIjKlMnOpQrStUvWxYz0123456789AbCdEfGhIjKlMnOpQrStUvWxYz">25,00 €</span></div>\n'
+    )
+    blob = '<img src="data:image/png;base64,' + 'iVBORw0KGgoAAAANSUhEUgAAAAEAAAAB' * 200 + '">\n'
+    body = []
+    total = 0
+    while total < size:
+        chunk = block * 50 + blob
+        body.append(chunk)
+        total += len(chunk)
+    footer = '<footer>Tél. 05 56 12 34 56 - contact@salon-exemple.fr</footer>'
+    return "<html><body>" + "".join(body) + (footer if contacts_at_end else "") + "</body></html>"
+
+def legacy_scan(text):
+    """Ancienne extraction : deux findall complets puis filtrage des images en Python."""
+    result = {"email": None, "telephone": None}
+    emails = re.findall(EMAIL_REGEX, text)
+    valid_emails = [e for e in emails if not e.lower().endswith(IMAGE_SUFFIXES)]
+    if valid_emails:
+        result["email"] = valid_emails[0].rstrip('.')
+    phones = re.findall(PHONE_REGEX, text)
+    if phones:
+        result["telephone"] = phones[0].replace(' ', '').replace('.', '').replace('-', '')
+    return result
+
+def single_pass_scan(text):
+    result = {"email": None, "telephone": None}
+    scan_contacts(text, result)
+    return result
+
+def timed(func, *args, repeat=3):
+    best = float("inf")
+    value = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        value = func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, value
+
+def bench_scanner(args):
+    for size_mb in (1, 5):
+        for with_contacts in (True, False):
+            page = make_page(size_mb * 1024 * 1024, contacts_at_end=with_contacts)
+            legacy_time, legacy_result = timed(legacy_scan, page, repeat=1)
+            new_time, new_result = timed(single_pass_scan, page)
+            assert legacy_result == new_result, (legacy_result, new_result)
+            label = "avec contacts" if with_contacts else "sans contacts"
+            print(f"{size_mb} Mo {label:14s} | findall x2 : {legacy_time * 1000:8.1f} ms | "
+                  f"scan unique : {new_time * 1000:8.1f} ms | x{legacy_time / new_time:.1f}")
+
+def load_corpus(directory):
+    """Pages HTML sauvegardées (*.html / *.htm) ; à défaut, pages synthétiques de tailles variées."""
+    pages = {}
+    if directory:
+        for path in sorted(glob.glob(os.path.join(directory, "*.htm*"))):
+            with open(path, encoding="utf-8", errors="replace") as f:
+                pages[os.path.basename(path)] = f.read()
+    if not pages:
+        for size_kb in (50, 200, 1000):
+            pages[f"synthétique {size_kb} Ko"] = make_page(size_kb * 1024)
+    return pages
+
+def bench_links(args):
+    total_soup = total_fast = 0.0
+    for name, page in load_corpus(args.corpus).items():
+        soup_time, soup_anchors = timed(_anchors_soup, page)
+        fast_time, fast_anchors = timed(_anchors_fast, page)
+        total_soup += soup_time
+        total_fast += fast_time
+        same = "identiques" if soup_anchors == fast_anchors else "DIFFÉRENTS"
+        print(f"{name:30s} | BeautifulSoup : {soup_time * 1000:8.1f} ms | HTMLParser : {fast_time * 1000:8.1f} ms | "
+              f"{len(fast_anchors)} liens {same}")
+    print(f"{'Total':30s} | BeautifulSoup : {total_soup * 1000:8.1f} ms | HTMLParser : {total_fast * 1000:8.1f} ms | "
+          f"x{total_soup / total_fast:.1f}")
+
+LEGACY_EXTERNAL_URL = r'https?://(?!.*linkedin\.com)[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(?:/[^\s"<]*)?'
+LEGACY_BLOCKLIST = ["google.com", "microsoft.com", "facebook.com", "twitter.com", "youtube.com", "cdn.", "static."]
+
+def make_linkedin_page(size):
+    """Page LinkedIn minifiée (une seule ligne) d'environ `size` octets, site de l'entreprise en fin de page."""
+    block = (
+        '<code style="display: none">{&quot;url&quot;:&quot;https://www.linkedin.com/company/acme-conseil/&quot;,'
+        '&quot;logo&quot;:&quot;https://media.licdn.com/dms/image/C4E0BAQ/company-logo_200_200/0/logo.png&quot;}</code>'
+        '<div class="org-top-card" data-tracking="' + 'aGVsbG8gd29ybGQ' * 100 + '"><span>Conseil en gestion</span></div>'
+    )
+    body = block * (size // len(block) + 1)
+    return '<html><body>' + body + '<a href="https://www.acme-conseil.fr/">acme-conseil.fr</a></body></html>'
+
+def legacy_external_url(html):
+    """Ancien repli LinkedIn : lookahead `(?!.*linkedin\.com)` rejoué à chaque URL candidate."""
+    for ext_url in re.findall(LEGACY_EXTERNAL_URL, html):
+        if any(d in ext_url for d in LEGACY_BLOCKLIST):
+            continue
+        return ext_url.split('"')[0].split("'")[0]
+    return None
+
+def first_external_url(html):
+    urls = rank_external_urls(html)
+    return urls[0] if urls else None
+
+def bench_linkedin_urls(args):
+    pages = {}
+    if args.corpus:
+        pages = {name: page for name, page in load_corpus(args.corpus).items() if not name.startswith("synthétique")}
+    if not pages:
+        pages = {f"synthétique {size_kb} Ko": make_linkedin_page(size_kb * 1024) for size_kb in (250, 1000, 3000)}
+    for name, page in pages.items():
+        legacy_time, legacy_url = timed(legacy_external_url, page, repeat=1)
+        new_time, new_url = timed(first_external_url, page)
+        print(f"{name:30s} | lookahead : {legacy_time * 1000:9.1f} ms ({legacy_url}) | "
+              f"jetons : {new_time * 1000:7.1f} ms ({new_url}) | x{legacy_time / new_time:.0f}")
+
+BENCHMARKS = {
+    "scanner": bench_scanner,
+    "links": bench_links,
+    "linkedin_urls": bench_linkedin_urls,
+}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-benchmarks de l'extraction de contacts.")
+    parser.add_argument("benchmarks", nargs="*", help=f"Benchmarks à lancer parmi {', '.join(BENCHMARKS)} (défaut: tous)")
+    parser.add_argument("--corpus", help="Dossier de pages HTML sauvegardées")
+    args = parser.parse_args()
+    unknown = [name for name in args.benchmarks if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"benchmark inconnu : {', '.join(unknown)}")
+    for name in args.benchmarks or list(BENCHMARKS):
+        print(f"== {name} ==")
+        BENCHMARKS[name](args)
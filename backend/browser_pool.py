@@ -0,0 +1,159 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from playwright.async_api import async_playwright
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BROWSERS = 2
+DEFAULT_CONTEXTS_PER_BROWSER = 4
+HEALTH_CHECK_INTERVAL = 30
+
+class _BrowserSlot:
+    def __init__(self, browser):
+        self.browser = browser
+        self.active = 0
+
+    @property
+    def alive(self):
+        return self.browser.is_connected()
+
+class BrowserPool:
+    """Navigateurs Chromium lancés une fois par process et partagés entre les tâches.
+
+    Chaque tâche reçoit un BrowserContext neuf (cookies et cache isolés) via `context()`.
+    Au plus `contexts_per_browser` contextes par navigateur ; un navigateur planté est
+    retiré dès qu'il n'a plus de contexte actif et remplacé au besoin. Chromium est lancé hors
+    du verrou (la place est réservée avant) : un lancement de quelques secondes ne bloque ni
+    les tâches qui rendent leur contexte ni le health-check.
+    """
+
+    def __init__(self, max_browsers=DEFAULT_MAX_BROWSERS, contexts_per_browser=DEFAULT_CONTEXTS_PER_BROWSER, launch_options=None):
+        self.max_browsers = max_browsers
+        self.contexts_per_browser = contexts_per_browser
+        self.launch_options = launch_options or {"headless": True}
+        self._playwright = None
+        self._slots = []
+        self._launching = 0
+        self._cond = asyncio.Condition()
+        self._monitor = None
+        self.restarts = 0
+
+    async def start(self):
+        """Démarre Playwright et un premier navigateur, pour que la première tâche n'attende pas."""
+        self._playwright = await async_playwright().start()
+        browser = await self._launch()
+        async with self._cond:
+            self._slots.append(_BrowserSlot(browser))
+        self._monitor = asyncio.create_task(self._health_loop())
+        logger.info("Pool de navigateurs démarré.")
+
+    async def stop(self):
+        if self._monitor:
+            self._monitor.cancel()
+            await asyncio.gather(self._monitor, return_exceptions=True)
+        async with self._cond:
+            for slot in self._slots:
+                try:
+                    await slot.browser.close()
+                except Exception:
+                    pass
+            self._slots.clear()
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def _launch(self):
+        return await self._playwright.chromium.launch(**self.launch_options)
+
+    async def _launch_reserved(self, active=0):
+        """Lance le navigateur d'une place réservée (`_launching`) et l'ajoute au pool."""
+        try:
+            browser = await self._launch()
+        except BaseException:
+            async with self._cond:
+                self._launching -= 1
+                self._cond.notify_all()
+            raise
+        slot = _BrowserSlot(browser)
+        slot.active = active
+        async with self._cond:
+            self._launching -= 1
+            self._slots.append(slot)
+            self._cond.notify_all()
+        return slot
+
+    def _drop_dead_slots(self):
+        for slot in [s for s in self._slots if not s.alive and s.active == 0]:
+            logger.warning("Navigateur déconnecté retiré du pool.")
+            self._slots.remove(slot)
+            self.restarts += 1
+
+    async def _acquire(self):
+        async with self._cond:
+            while True:
+                self._drop_dead_slots()
+                candidates = [s for s in self._slots if s.alive and s.active < self.contexts_per_browser]
+                if candidates:
+                    slot = min(candidates, key=lambda s: s.active)
+                    slot.active += 1
+                    return slot
+                if len(self._slots) + self._launching < self.max_browsers:
+                    self._launching += 1
+                    break
+                await self._cond.wait()
+        # Le contexte demandé compte déjà sur le nouveau navigateur
+        return await self._launch_reserved(active=1)
+
+    async def _release(self, slot):
+        async with self._cond:
+            slot.active -= 1
+            self._drop_dead_slots()
+            self._cond.notify_all()
+
+    @asynccontextmanager
+    async def context(self, **context_options):
+        """Fournit un BrowserContext neuf, fermé à la sortie du bloc."""
+        slot = await self._acquire()
+        try:
+            context = await slot.browser.new_context(**context_options)
+        except BaseException:
+            await self._release(slot)
+            raise
+        try:
+            yield context
+        finally:
+            try:
+                await context.close()
+            except Exception:
+                pass
+            await self._release(slot)
+
+    async def health_check(self):
+        """Retire les navigateurs plantés et garde au moins un navigateur chaud."""
+        async with self._cond:
+            self._drop_dead_slots()
+            relaunch = not self._slots and not self._launching
+            if relaunch:
+                self._launching += 1
+            self._cond.notify_all()
+        if relaunch:
+            logger.info("Relance d'un navigateur pour le pool.")
+            await self._launch_reserved()
+
+    async def _health_loop(self):
+        while True:
+            await asyncio.sleep(HEALTH_CHECK_INTERVAL)
+            try:
+                await self.health_check()
+            except Exception as e:
+                logger.error(f"Health-check du pool de navigateurs en échec : {e}")
+
+    def stats(self):
+        return {
+            "browsers": len(self._slots),
+            "launching": self._launching,
+            "alive": sum(1 for s in self._slots if s.alive),
+            "active_contexts": sum(s.active for s in self._slots),
+            "restarts": self.restarts,
+        }
@@ -0,0 +1,137 @@
+"""Capture d'une vraie réponse de recherche Maps, anonymisée, pour tester maps_payload hors ligne.
+
+    python capture_maps_fixture.py "coiffeur bordeaux" fixtures/maps_search_coiffeur_bordeaux
+
+Écrit `<sortie>.txt` (le payload tel que reçu, enveloppe comprise) et `<sortie>.expected.json` :
+les cartes du flux lues dans le DOM (nom, site, téléphone, cid). Cette source ne doit rien aux
+index du parseur, si bien que le test échoue si Maps déplace un champ. Noms, sites et
+téléphones sont remplacés de la même façon dans les deux fichiers ; une fiche du payload absente
+du flux affiché garde ses vraies valeurs : relire le fichier avant de le committer.
+"""
+import argparse
+import asyncio
+import json
+import logging
+from urllib.parse import urlsplit
+
+from playwright.async_api import async_playwright
+
+from contact_scanner import PHONE_PATTERN, normalize_phone
+from geo_grid import maps_search_url
+from maps_feed import harvest_feed
+from maps_payload import PAYLOAD_URL_MARKERS, XSSI_PREFIX, _clean_website, _strip_payload
+from maps_scraper import CONTEXT_OPTIONS, handle_cookies, scroll_feed
+from waits import CARD_SELECTOR
+
+logger = logging.getLogger(__name__)
+
+FEED_SELECTOR = 'div[role="feed"]'
+CARD_TEXT_JS = "(selector) => Array.from(document.querySelectorAll(selector)).map(card => card.innerText || '')"
+
+async def capture(query, scrolls):
+    """(réponses XHR Maps reçues, cartes du flux avec leur texte) pour la recherche `query`."""
+    bodies = []
+    reads = []
+
+    async def keep(response):
+        try:
+            bodies.append(await response.text())
+        except Exception as e:
+            logger.debug(f"Corps indisponible ({response.url}): {e}")
+
+    def on_response(response):
+        if any(marker in response.url for marker in PAYLOAD_URL_MARKERS):
+            reads.append(asyncio.ensure_future(keep(response)))
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            context = await browser.new_context(**CONTEXT_OPTIONS)
+            page = await context.new_page()
+            page.on("response", on_response)
+            await page.goto(maps_search_url(query))
+            await handle_cookies(page)
+            await page.wait_for_selector(FEED_SELECTOR, timeout=15000)
+            for _ in range(scrolls):
+                await scroll_feed(page, FEED_SELECTOR)
+            await asyncio.gather(*reads, return_exceptions=True)
+            cards = await harvest_feed(page)
+            texts = await page.evaluate(CARD_TEXT_JS, CARD_SELECTOR)
+        finally:
+            await browser.close()
+    for card, text in zip(cards, texts):
+        phone = PHONE_PATTERN.search(text)
+        card["telephone"] = phone.group() if phone else None
+    return bodies, [card for card in cards if card["cid"]]
+
+def anonymize(cards):
+    """(cartes anonymisées, table valeur réelle -> valeur de remplacement)."""
+    replacements = {}
+    expected = []
+    for n, card in enumerate(cards, 1):
+        name = f"Entreprise {n}"
+        website = _clean_website(card["website"])
+        phone = f"01 00 00 {n // 100:02d} {n % 100:02d}" if card["telephone"] else None
+        if card["name"]:
+            replacements[card["name"]] = name
+        if website:
+            replacements[website] = f"https://entreprise-{n}.example/"
+            host = (urlsplit(website).hostname or "").removeprefix("www.")
+            if host:
+                replacements[host] = f"entreprise-{n}.example"
+        if phone:
+            real, fake = normalize_phone(card["telephone"]), normalize_phone(phone)
+            replacements[card["telephone"]] = phone
+            replacements[real] = fake
+            replacements["+33" + real[1:]] = "+33" + fake[1:]
+        expected.append({
+            "name": name if card["name"] else None,
+            "website": replacements.get(website),
+            "telephone": phone,
+            "cid": card["cid"],
+        })
+    return expected, replacements
+
+def _replace(node, replacements):
+    if isinstance(node, list):
+        return [_replace(child, replacements) for child in node]
+    if isinstance(node, dict):
+        return {key: _replace(value, replacements) for key, value in node.items()}
+    if isinstance(node, str):
+        # Les plus longues d'abord : un nom peut en contenir un autre
+        for real in sorted(replacements, key=len, reverse=True):
+            if real in node:
+                node = node.replace(real, replacements[real])
+    return node
+
+def anonymize_payload(text, replacements):
+    """Payload réécrit avec les valeurs de remplacement, enveloppe {"c","d"} et préfixe anti-XSSI conservés."""
+    data = json.loads(_strip_payload(text))
+    if isinstance(data, dict) and isinstance(data.get("d"), str):
+        inner = _replace(json.loads(_strip_payload(data["d"])), replacements)
+        data["d"] = f"{XSSI_PREFIX}\n{json.dumps(inner, ensure_ascii=False)}"
+        return json.dumps(data, ensure_ascii=False)
+    return f"{XSSI_PREFIX}\n{json.dumps(_replace(data, replacements), ensure_ascii=False)}"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("query")
+    parser.add_argument("output", help="chemin sans extension, ex. fixtures/maps_search_coiffeur_bordeaux")
+    parser.add_argument("--scrolls", type=int, default=3)
+    args = parser.parse_args()
+
+    bodies, cards = asyncio.run(capture(args.query, args.scrolls))
+    if not bodies or not cards:
+        raise SystemExit("Aucune réponse Maps ou aucune carte capturée.")
+    # Le payload retenu est celui qui cite le plus de cartes du DOM (simple recherche de cid dans le texte)
+    body = max(bodies, key=lambda text: sum(card["cid"] in text for card in cards))
+    cards = [card for card in cards if card["cid"] in body]
+    expected, replacements = anonymize(cards)
+    with open(f"{args.output}.txt", "w", encoding="utf-8") as f:
+        f.write(anonymize_payload(body, replacements))
+    with open(f"{args.output}.expected.json", "w", encoding="utf-8") as f:
+        json.dump(expected, f, ensure_ascii=False, indent=2)
+    print(f"{args.output}.txt : {len(cards)} cartes attendues")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import re
+
+EMAIL_REGEX = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+PHONE_REGEX = r'(?:(?:\+|00)33|0)[1-9](?:[\s.-]*\d{2}){4}'
+
+# Email précompilé : ne démarre qu'en début de partie locale (pas de re-tentative à chaque caractère
+# d'un long mot), domaine pris en entier (groupe atomique émulé par lookahead) puis rejeté s'il
+# se termine par une extension d'image (logo@2x.png).
+_EMAIL = (
+    r'(?<![a-zA-Z0-9._%+-])[a-zA-Z0-9._%+-]+@'
+    r'(?=(?P<domain>[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}))(?P=domain)'
+    r'(?<!\.png)(?<!\.jpg)(?<!\.jpeg)(?<!\.gif)(?<!\.svg)(?<!\.webp)'
+)
+
+EMAIL_PATTERN = re.compile(_EMAIL, re.IGNORECASE)
+PHONE_PATTERN = re.compile(PHONE_REGEX)
+CONTACT_PATTERN = re.compile(rf'(?P<email>{_EMAIL})|(?P<phone>{PHONE_REGEX})', re.IGNORECASE)
+
+_PHONE_SEPARATORS = re.compile(r'[\s.-]')
+
+def normalize_email(email):
+    return email.rstrip('.')
+
+def normalize_phone(phone):
+    return _PHONE_SEPARATORS.sub('', phone)
+
+# Caractères gardés avant la reprise d'un morceau à l'autre : le lookbehind de l'email doit voir
+# ce qui précède (sinon « 56contact@... » serait lu comme un email commençant au milieu d'un mot)
+_LOOKBEHIND_CONTEXT = 8
+
+def scan_contacts(text, result, endpos=None):
+    """Complète en un seul passage les champs email/téléphone encore vides de `result`.
+
+    Même résultat que deux recherches séparées (premier email, premier téléphone du texte), mais
+    le parcours s'arrête dès que les deux champs sont connus. Retourne True dans ce cas.
+    Avec `endpos`, la suite du texte n'est pas encore reçue : seules comptent les correspondances
+    qui commencent avant `endpos` et finissent avant la fin du texte. La recherche va jusqu'au bout
+    du texte reçu, sinon le moteur se replierait sur un domaine raccourci (contact@www.salon).
+    """
+    return _scan(text, result, 0, endpos)[0]
+
+def _scan(text, result, pos, endpos):
+    """(terminé, position où reprendre la recherche quand la suite du texte arrivera)."""
+    while True:
+        need_email = not result["email"]
+        need_phone = not result["telephone"]
+        if need_email and need_phone:
+            pattern = CONTACT_PATTERN
+        elif need_email:
+            pattern = EMAIL_PATTERN
+        elif need_phone:
+            pattern = PHONE_PATTERN
+        else:
+            return True, pos
+
+        # Reprise à `pos` sans découper le texte : un seul parcours du document au total
+        match = pattern.search(text, pos)
+        if endpos is not None:
+            if not match or match.start() >= endpos:
+                # Rien ne commence avant `endpos` : la recherche reprendra là
+                return False, max(pos, endpos)
+            if match.end() >= len(text):
+                # Peut-être coupée par la fin du morceau : revue avec le morceau suivant
+                return False, match.start()
+        elif not match:
+            return False, len(text)
+        # Reprise au début de la correspondance, pas à sa fin : l'autre champ peut la chevaucher
+        # (0612345678info@salon.fr contient aussi un téléphone)
+        pos = match.start()
+        if pattern is CONTACT_PATTERN:
+            if match.group("email"):
+                result["email"] = normalize_email(match.group("email"))
+            else:
+                result["telephone"] = normalize_phone(match.group("phone"))
+        elif pattern is EMAIL_PATTERN:
+            result["email"] = normalize_email(match.group(0))
+        else:
+            result["telephone"] = normalize_phone(match.group(0))
+
+class IncrementalScanner:
+    """Applique scan_contacts à un corps reçu par morceaux, avec le même résultat que sur le corps entier.
+
+    Seules les correspondances qui commencent avant les `overlap` derniers caractères reçus sont
+    retenues ; la recherche reprend au morceau suivant là où elle s'était arrêtée, jamais dans
+    une correspondance déjà lue. `overlap` doit dépasser la longueur du plus long email ou
+    téléphone attendu.
+    """
+
+    def __init__(self, result, overlap=256):
+        self.result = result
+        self.overlap = overlap
+        self._tail = ""
+        self._pos = 0
+
+    @property
+    def complete(self):
+        return bool(self.result["email"] and self.result["telephone"])
+
+    def feed(self, chunk):
+        """Analyse un morceau. Retourne True dès que l'email et le téléphone sont connus."""
+        text = self._tail + chunk
+        endpos = len(text) - self.overlap
+        if endpos <= self._pos:
+            self._tail = text
+            return self.complete
+        done, resume = _scan(text, self.result, self._pos, endpos)
+        if done:
+            return True
+        keep = max(0, resume - _LOOKBEHIND_CONTEXT)
+        self._tail = text[keep:]
+        self._pos = resume - keep
+        return False
+
+    def close(self):
+        """Fin du corps : analyse ce qui reste en attente."""
+        done = _scan(self._tail, self.result, self._pos, None)[0]
+        self._tail = ""
+        self._pos = 0
+        return done
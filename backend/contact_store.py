@@ -0,0 +1,111 @@
+import asyncio
+import sqlite3
+import threading
+import time
+import logging
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = "contacts.sqlite3"
+POSITIVE_TTL = 30 * 24 * 3600
+NEGATIVE_TTL = 2 * 24 * 3600
+
+def normalize_domain(url):
+    """Domaine d'un site : hôte en minuscules, sans port ni préfixe www."""
+    if "://" not in url:
+        url = f"http://{url}"
+    host = (urlsplit(url.strip()).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+def site_key(url):
+    """Clé d'un site : son domaine si l'URL est une page d'accueil, sinon domaine + chemin.
+
+    Les plateformes partagées (planity.com/salon-a, planity.com/salon-b) hébergent plusieurs
+    entreprises sur un même hôte : leurs contacts ne doivent pas se mélanger.
+    """
+    domain = normalize_domain(url)
+    path = urlsplit(url.strip() if "://" in url else f"http://{url.strip()}").path.rstrip("/")
+    if not domain or not path:
+        return domain
+    return f"{domain}{path}"
+
+class ContactStore:
+    """Mémorise par site (voir `site_key`) le dernier email/téléphone extrait, y compris les résultats vides.
+
+    Un résultat avec email reste valable `positive_ttl` secondes, un résultat vide
+    seulement `negative_ttl` (le site a pu être mis à jour entre-temps). Les requêtes SQLite
+    tournent hors de la boucle asyncio, sur une connexion protégée par un verrou. La base n'est
+    ouverte que par `open()` : avant, aucun contact n'est connu ni mémorisé.
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH, positive_ttl=POSITIVE_TTL, negative_ttl=NEGATIVE_TTL):
+        self.path = path
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.counters = {"hits": 0, "negative_hits": 0, "misses": 0, "stores": 0}
+        self._lock = threading.Lock()
+        self._conn = None
+
+    @property
+    def is_open(self):
+        return self._conn is not None
+
+    def open(self):
+        if self.is_open:
+            return
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS contacts ("
+            "domain TEXT PRIMARY KEY, email TEXT, telephone TEXT, checked_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _select(self, key):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT email, telephone, checked_at FROM contacts WHERE domain = ?", (key,)
+            ).fetchone()
+
+    def _upsert(self, key, contacts):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO contacts (domain, email, telephone, checked_at) VALUES (?, ?, ?, ?)",
+                (key, contacts.get("email"), contacts.get("telephone"), time.time()),
+            )
+            self._conn.commit()
+
+    async def get(self, url):
+        """Contacts connus et encore valides pour le site `url`, sinon None."""
+        if not self.is_open:
+            return None
+        row = await asyncio.to_thread(self._select, site_key(url))
+        if row:
+            email, telephone, checked_at = row
+            ttl = self.positive_ttl if email else self.negative_ttl
+            if time.time() - checked_at < ttl:
+                self.counters["hits" if email else "negative_hits"] += 1
+                return {"email": email, "telephone": telephone}
+        self.counters["misses"] += 1
+        return None
+
+    async def put(self, url, contacts):
+        key = site_key(url)
+        if not key or not self.is_open:
+            return
+        await asyncio.to_thread(self._upsert, key, contacts)
+        self.counters["stores"] += 1
+
+    def stats(self):
+        return dict(self.counters)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+# Partagé par toutes les tâches : un site résolu hier n'est pas revisité aujourd'hui. Ouvert par
+# le lifespan de main.py, ou par run_scraper en ligne de commande
+CONTACT_STORE = ContactStore()
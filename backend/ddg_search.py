@@ -0,0 +1,79 @@
+"""Recherche de pages LinkedIn Company via DuckDuckGo HTML (pas de CAPTCHA), page de résultats par page de résultats."""
+import asyncio
+import logging
+from urllib.parse import parse_qs, urlsplit
+
+from link_extractor import iter_anchors
+
+logger = logging.getLogger(__name__)
+
+DDG_HTML_URL = "https://html.duckduckgo.com/html/"
+DDG_HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+# DuckDuckGo HTML sert 30 résultats en première page puis 50 par page (paramètre `s`)
+FIRST_PAGE_SIZE = 30
+PAGE_SIZE = 50
+MAX_PAGES = 10
+
+def page_offset(page_number):
+    return 0 if page_number == 0 else FIRST_PAGE_SIZE + (page_number - 1) * PAGE_SIZE
+
+def _result_url(href):
+    """URL réelle d'un résultat, extraite des redirections DDG (`/l/?uddg=...`)."""
+    if "uddg=" in href:
+        target = parse_qs(urlsplit(href).query).get("uddg")
+        if target:
+            return target[0]
+    return href
+
+def parse_serp(html, marker="linkedin.com/company/"):
+    """Résultats (url, titre) d'une page DDG dont l'URL contient `marker`, dans l'ordre de la page."""
+    results = {}
+    for href, text in iter_anchors(html):
+        url = _result_url(href)
+        # Le premier lien d'un résultat est son titre ; les suivants (URL affichée, extrait) sont ignorés
+        if marker in url and url not in results:
+            results[url] = " ".join(text.split()) or "Inconnu"
+    return list(results.items())
+
+async def fetch_serp(client, query, page_number, timeout=15):
+    response = await client.get(
+        DDG_HTML_URL,
+        params={"q": query, "s": page_offset(page_number)} if page_number else {"q": query},
+        headers=DDG_HEADERS,
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    return response.text
+
+async def search_linkedin_companies(client, query, wanted, stop=None, concurrency=3, max_pages=MAX_PAGES):
+    """Générateur asynchrone de (url, titre) de pages LinkedIn Company, au fil des pages de résultats.
+
+    Les pages sont demandées `concurrency` à la fois, jusqu'à `wanted` résultats distincts,
+    une vague sans nouveau résultat (fin des résultats) ou l'événement `stop` levé.
+    """
+    seen = set()
+    next_page = 0
+    while len(seen) < wanted and next_page < max_pages and not (stop and stop.is_set()):
+        wave = range(next_page, min(next_page + concurrency, max_pages))
+        next_page = wave.stop
+        fresh = 0
+        tasks = [asyncio.create_task(fetch_serp(client, query, n)) for n in wave]
+        try:
+            for pending in asyncio.as_completed(tasks):
+                try:
+                    html = await pending
+                except Exception as e:
+                    logger.error(f"Erreur DuckDuckGo HTML : {e}")
+                    continue
+                for url, title in parse_serp(html):
+                    if url in seen:
+                        continue
+                    seen.add(url)
+                    fresh += 1
+                    yield url, title
+        finally:
+            # Consommateur arrêté en cours de vague : les pages encore en vol sont abandonnées
+            for task in tasks:
+                task.cancel()
+        if not fresh:
+            break
@@ -0,0 +1,141 @@
+"""Filtre des domaines inexistants (NXDOMAIN), pour écarter les sites morts avant toute requête HTTP.
+
+Ce n'est pas un cache DNS pour httpx : le client résout toujours lui-même les hôtes qu'il
+contacte. Le gain est d'éviter la tentative de connexion (et ses retries) vers un domaine
+qui n'existe pas, pas d'économiser la résolution des domaines vivants.
+
+Vérification à la main (résolveur système) :
+
+    python domain_filter.py exemple.fr domaine-qui-n-existe-pas.fr
+"""
+import asyncio
+import socket
+import sys
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POSITIVE_TTL = 300
+DEFAULT_NEGATIVE_TTL = 3600
+DEFAULT_TIMEOUT = 3.0
+# Pool de threads propre aux résolutions : getaddrinfo est bloquant, et l'exécuteur par défaut
+# de la boucle est partagé avec le cache HTTP (asyncio.to_thread)
+RESOLVER_THREADS = 4
+_RESOLVER_EXECUTOR = ThreadPoolExecutor(max_workers=RESOLVER_THREADS, thread_name_prefix="domain-filter")
+
+# Le domaine n'existe pas ou n'a aucune adresse : inutile de tenter une connexion
+NXDOMAIN_ERRORS = {socket.EAI_NONAME, getattr(socket, "EAI_NODATA", socket.EAI_NONAME)}
+
+async def system_resolver(host):
+    """Adresses IP de `host` via getaddrinfo, exécuté dans le pool de threads du filtre."""
+    infos = await asyncio.get_running_loop().run_in_executor(
+        _RESOLVER_EXECUTOR, socket.getaddrinfo, host, None, 0, socket.SOCK_STREAM
+    )
+    return sorted({info[4][0] for info in infos})
+
+class DomainFilter:
+    """Verdict « le domaine existe-t-il ? » mis en cache : `positive_ttl` s'il existe, `negative_ttl` sinon.
+
+    `resolver(host)` est une coroutine qui retourne les adresses ou lève socket.gaierror ; elle est
+    injectable (résolveur de test). Une seule résolution à la fois par hôte, les appels concurrents
+    attendent la même. Toute autre erreur que NXDOMAIN (timeout, EAI_AGAIN, nom invalide) n'est
+    pas mise en cache et ne condamne pas le domaine. Les adresses trouvées ne servent qu'au verdict : httpx ne les
+    réutilise pas.
+    """
+
+    def __init__(self, resolver=system_resolver, positive_ttl=DEFAULT_POSITIVE_TTL,
+                 negative_ttl=DEFAULT_NEGATIVE_TTL, timeout=DEFAULT_TIMEOUT):
+        self.resolver = resolver
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.timeout = timeout
+        self.counters = {"hits": 0, "negative_hits": 0, "misses": 0, "nxdomain": 0, "errors": 0, "prefetches": 0}
+        self._entries = {}
+        self._inflight = {}
+        self._prefetch_tasks = set()
+
+    @staticmethod
+    def host_of(url_or_host):
+        if "://" in url_or_host:
+            return (urlsplit(url_or_host).hostname or "").lower()
+        return url_or_host.lower()
+
+    def _cached(self, host):
+        entry = self._entries.get(host)
+        if entry and entry[0] > time.monotonic():
+            return entry
+        return None
+
+    async def resolve(self, url_or_host):
+        """Adresses de l'hôte ; [] si le domaine n'existe pas ; None si la résolution a échoué temporairement."""
+        host = self.host_of(url_or_host)
+        if not host:
+            return None
+        entry = self._cached(host)
+        if entry:
+            self.counters["hits" if entry[1] else "negative_hits"] += 1
+            return entry[1]
+        inflight = self._inflight.get(host)
+        if inflight is None:
+            self.counters["misses"] += 1
+            inflight = asyncio.ensure_future(self._lookup(host))
+            self._inflight[host] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(host, None))
+        return await asyncio.shield(inflight)
+
+    async def _lookup(self, host):
+        try:
+            addresses = await asyncio.wait_for(self.resolver(host), self.timeout)
+        except socket.gaierror as e:
+            if e.errno not in NXDOMAIN_ERRORS:
+                self.counters["errors"] += 1
+                logger.debug(f"Résolution DNS en échec temporaire ({host}): {e}")
+                return None
+            self.counters["nxdomain"] += 1
+            self._entries[host] = (time.monotonic() + self.negative_ttl, [])
+            return []
+        except Exception as e:
+            # Timeout, OSError, UnicodeError (label de plus de 63 caractères)... : dans le doute, on tente HTTP
+            self.counters["errors"] += 1
+            logger.debug(f"Résolution DNS en échec temporaire ({host}): {e!r}")
+            return None
+        self._entries[host] = (time.monotonic() + self.positive_ttl, list(addresses))
+        return list(addresses)
+
+    async def exists(self, url_or_host):
+        """False seulement si le domaine est certainement inexistant (NXDOMAIN) : dans le doute, on tente HTTP."""
+        return await self.resolve(url_or_host) != []
+
+    def prefetch(self, url_or_host):
+        """Lance la vérification en tâche de fond, dès la découverte du site, pour trouver le verdict prêt à l'enrichissement."""
+        host = self.host_of(url_or_host)
+        if not host or self._cached(host) or host in self._inflight:
+            return
+        self.counters["prefetches"] += 1
+        task = asyncio.ensure_future(self.resolve(host))
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+
+    def stats(self):
+        now = time.monotonic()
+        live = [entry for entry in self._entries.values() if entry[0] > now]
+        return {
+            **self.counters,
+            "entries": len(live),
+            "dead_domains": sum(1 for entry in live if not entry[1]),
+        }
+
+DOMAIN_FILTER = DomainFilter()
+
+if __name__ == "__main__":
+    async def main():
+        for host in sys.argv[1:]:
+            started = time.monotonic()
+            addresses = await DOMAIN_FILTER.resolve(host)
+            print(f"{host} : {addresses} ({(time.monotonic() - started) * 1000:.0f} ms)")
+        print(DOMAIN_FILTER.stats())
+
+    asyncio.run(main())
@@ -0,0 +1,63 @@
+"""Découpage d'une ville en sous-recherches Maps centrées sur une grille de points.
+
+Une recherche Maps plafonne vers 120 fiches : chaque case de la grille est une recherche
+`/maps/search/<requête>/@lat,lng,zoomz` sur une zone plus petite, avec son propre plafond.
+"""
+import math
+import re
+from urllib.parse import quote_plus
+
+VIEWPORT_PATTERN = re.compile(r'@(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?),(\d+(?:\.\d+)?)z')
+
+# Taille par défaut de la fenêtre du navigateur, qui fixe la zone couverte à un zoom donné ;
+# l'appelant passe celle de ses contextes Playwright
+DEFAULT_VIEWPORT = (1280, 800)
+TILE_SIZE = 256
+MAX_ZOOM = 21
+# Pas de la grille = 85 % de la vue d'une case : les cases voisines se chevauchent de 15 %
+SHARD_OVERLAP = 0.85
+
+def parse_viewport(url):
+    """(lat, lng, zoom) lus dans une URL Maps `.../@48.8566,2.3522,12z`, ou None."""
+    match = VIEWPORT_PATTERN.search(url or "")
+    if not match:
+        return None
+    return float(match.group(1)), float(match.group(2)), float(match.group(3))
+
+def viewport_span(lat, zoom, viewport=DEFAULT_VIEWPORT):
+    """Étendue (degrés de latitude, degrés de longitude) affichée à ce zoom (projection Mercator)."""
+    width, height = viewport
+    degrees_per_pixel = 360 / (TILE_SIZE * 2 ** zoom)
+    lng_span = width * degrees_per_pixel
+    lat_span = height * degrees_per_pixel * math.cos(math.radians(lat))
+    return lat_span, lng_span
+
+def grid_shards(lat, lng, zoom, size, viewport=DEFAULT_VIEWPORT):
+    """Centres (lat, lng, zoom) d'une grille `size` x `size` couvrant la vue de la ville.
+
+    Le zoom des cases (fractionnaire, accepté par Maps) est choisi pour qu'une case couvre
+    1 / (`size` x SHARD_OVERLAP) de la vue de la ville, et les centres sont espacés de
+    SHARD_OVERLAP fois cette vue : les cases se chevauchent, aucune zone n'est oubliée, les
+    doublons sont écartés par l'appelant.
+    """
+    if size <= 1:
+        return [(lat, lng, zoom)]
+    shard_zoom = min(MAX_ZOOM, round(zoom + math.log2(size * SHARD_OVERLAP), 2))
+    lat_span, lng_span = viewport_span(lat, shard_zoom, viewport)
+    lat_step, lng_step = lat_span * SHARD_OVERLAP, lng_span * SHARD_OVERLAP
+    offset = (size - 1) / 2
+    return [
+        (
+            lat + (offset - row) * lat_step,
+            lng + (col - offset) * lng_step,
+            shard_zoom,
+        )
+        for row in range(size)
+        for col in range(size)
+    ]
+
+def maps_search_url(search_query, lat=None, lng=None, zoom=None):
+    url = f"https://www.google.com/maps/search/{quote_plus(search_query)}"
+    if lat is not None:
+        url += f"/@{lat:.6f},{lng:.6f},{zoom:g}z"
+    return url
@@ -0,0 +1,184 @@
+import asyncio
+import itertools
+import time
+import logging
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Politesse par défaut : 2 requêtes en vol par hôte, 2 req/s en régime établi, 200 au total
+DEFAULT_PER_HOST = 2
+DEFAULT_HOST_RATE = 2.0
+DEFAULT_HOST_BURST = 2
+DEFAULT_GLOBAL_LIMIT = 200
+# Les hôtes inactifs (rien en vol ni en attente, seau plein) sont oubliés au plus toutes les 60 s
+IDLE_SWEEP_INTERVAL = 60.0
+
+class TokenBucket:
+    """Seau à jetons : `rate` jetons par seconde, au plus `burst` accumulés."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def is_full(self, now):
+        return self.tokens + (now - self.updated) * self.rate >= self.burst
+
+class _HostState:
+    def __init__(self, per_host, rate, burst):
+        self.semaphore = asyncio.Semaphore(per_host)
+        self.bucket = TokenBucket(rate, burst)
+        self.in_flight = 0
+        self.waiting = {}
+        self.requests = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def is_idle(self, now):
+        """Rien en vol, personne en attente et seau rechargé : l'oublier ne change aucun délai."""
+        return not self.in_flight and not self.waiting and self.bucket.is_full(now)
+
+class HostScheduler:
+    """Limite la concurrence et le débit par hôte, plus un plafond global, et mesure l'attente."""
+
+    def __init__(self, per_host=DEFAULT_PER_HOST, rate=DEFAULT_HOST_RATE, burst=DEFAULT_HOST_BURST, global_limit=DEFAULT_GLOBAL_LIMIT):
+        self.per_host = per_host
+        self.rate = rate
+        self.burst = burst
+        self.global_limit = global_limit
+        self.global_semaphore = asyncio.Semaphore(global_limit)
+        self.hosts = {}
+        self.evicted_hosts = 0
+        self._ids = itertools.count()
+        self._last_sweep = time.monotonic()
+
+    def _host(self, host):
+        state = self.hosts.get(host)
+        if state is None:
+            self._evict_idle()
+            state = self.hosts[host] = _HostState(self.per_host, self.rate, self.burst)
+        return state
+
+    def _evict_idle(self):
+        """Oublie les hôtes inactifs : un process qui tourne longtemps voit défiler des milliers de domaines."""
+        now = time.monotonic()
+        if now - self._last_sweep < IDLE_SWEEP_INTERVAL:
+            return
+        self._last_sweep = now
+        idle = [host for host, state in self.hosts.items() if state.is_idle(now)]
+        for host in idle:
+            del self.hosts[host]
+        self.evicted_hosts += len(idle)
+        if idle:
+            logger.debug(f"{len(idle)} hôtes inactifs oubliés par l'ordonnanceur")
+
+    async def acquire(self, host):
+        """Attend un créneau pour `host` et retourne la fonction de libération."""
+        host = (host or "").lower()
+        state = self._host(host)
+        ticket = next(self._ids)
+        started = time.monotonic()
+        state.waiting[ticket] = started
+        try:
+            await state.semaphore.acquire()
+            try:
+                await state.bucket.acquire()
+                await self.global_semaphore.acquire()
+            except BaseException:
+                state.semaphore.release()
+                raise
+        finally:
+            del state.waiting[ticket]
+
+        waited = time.monotonic() - started
+        state.requests += 1
+        state.total_wait += waited
+        state.max_wait = max(state.max_wait, waited)
+        state.in_flight += 1
+
+        released = False
+        def release():
+            nonlocal released
+            if released:
+                return
+            released = True
+            state.in_flight -= 1
+            self.global_semaphore.release()
+            state.semaphore.release()
+        return release
+
+    def snapshot(self):
+        """État courant par hôte : requêtes en vol, en attente et temps d'attente (secondes)."""
+        now = time.monotonic()
+        hosts = {}
+        for host, state in self.hosts.items():
+            hosts[host] = {
+                "in_flight": state.in_flight,
+                "waiting": len(state.waiting),
+                "current_wait": round(now - min(state.waiting.values()), 3) if state.waiting else 0.0,
+                "avg_wait": round(state.total_wait / state.requests, 3) if state.requests else 0.0,
+                "max_wait": round(state.max_wait, 3),
+                "requests": state.requests,
+            }
+        return {
+            "global_limit": self.global_limit,
+            "in_flight": sum(s.in_flight for s in self.hosts.values()),
+            "evicted_hosts": self.evicted_hosts,
+            "hosts": hosts,
+        }
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Libère le créneau de l'hôte quand le corps de la réponse est fermé, pas dès les en-têtes."""
+
+    def __init__(self, stream, release):
+        self.stream = stream
+        self.release = release
+
+    async def __aiter__(self):
+        async for chunk in self.stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self.stream.aclose()
+        finally:
+            self.release()
+
+class PoliteTransport(httpx.AsyncBaseTransport):
+    """Transport httpx qui fait passer chaque requête (redirections comprises) par un HostScheduler."""
+
+    def __init__(self, scheduler, transport=None, **transport_kwargs):
+        self.scheduler = scheduler
+        self.transport = transport or httpx.AsyncHTTPTransport(**transport_kwargs)
+
+    async def handle_async_request(self, request):
+        release = await self.scheduler.acquire(request.url.host)
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+        if response.is_closed:
+            # Corps déjà entièrement en mémoire : rien ne viendra appeler aclose()
+            release()
+        else:
+            response.stream = _ReleasingStream(response.stream, release)
+        return response
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+# Partagé par toutes les tâches du process : la politesse vaut pour l'hôte, pas pour la tâche
+HOST_SCHEDULER = HostScheduler()
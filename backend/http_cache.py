@@ -0,0 +1,196 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+import logging
+from collections import OrderedDict
+from urllib.parse import urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = ".http_cache"
+DEFAULT_TTL = 24 * 3600
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+def normalize_url(url):
+    """Clé de cache : schéma et hôte en minuscules, sans fragment ni port par défaut."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{parts.port}"
+    return urlunsplit((scheme, host, parts.path or "/", parts.query, ""))
+
+class CacheEntry:
+    def __init__(self, key, meta, text):
+        self.key = key
+        self.meta = meta
+        self.text = text
+
+    @property
+    def etag(self):
+        return self.meta.get("etag")
+
+    @property
+    def last_modified(self):
+        return self.meta.get("last_modified")
+
+class HttpCache:
+    """Cache HTTP sur disque (un fichier meta JSON + un fichier corps par URL), borné en taille par LRU.
+
+    Une entrée plus jeune que `ttl` est servie sans réseau ; au-delà, elle est revalidée avec
+    If-None-Match / If-Modified-Since. Rien n'est créé sur disque avant `open()` : tant que le
+    cache n'est pas ouvert, chaque lecture est un échec et rien n'est écrit.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.counters = {"hits": 0, "misses": 0, "stale": 0, "revalidated": 0, "stores": 0, "evictions": 0}
+        self._index = OrderedDict()
+        self._size = 0
+        self.is_open = False
+
+    def open(self):
+        """Crée le répertoire et relit l'index des entrées déjà présentes."""
+        if self.is_open:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        self._load_index()
+        self.is_open = True
+
+    def _paths(self, key):
+        base = os.path.join(self.directory, key)
+        return base + ".json", base + ".body"
+
+    def _load_index(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            key = name[:-5]
+            meta_path, body_path = self._paths(key)
+            try:
+                size = os.path.getsize(meta_path) + os.path.getsize(body_path)
+                entries.append((os.path.getmtime(meta_path), key, size))
+            except OSError:
+                continue
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._size += size
+        self._evict()
+
+    @staticmethod
+    def key_for(url):
+        return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+
+    def _read(self, key):
+        meta_path, body_path = self._paths(key)
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(body_path, encoding="utf-8") as f:
+            text = f.read()
+        os.utime(meta_path)
+        return CacheEntry(key, meta, text)
+
+    def _write_meta(self, key, meta):
+        meta_path, _ = self._paths(key)
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+    def _write(self, key, meta, text):
+        meta_path, body_path = self._paths(key)
+        with open(body_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        self._write_meta(key, meta)
+        return os.path.getsize(meta_path) + os.path.getsize(body_path)
+
+    async def lookup(self, url):
+        """Retourne (entrée, fraîche). L'entrée est None en cas d'absence."""
+        if not self.is_open:
+            return None, False
+        key = self.key_for(url)
+        if key not in self._index:
+            self.counters["misses"] += 1
+            return None, False
+        try:
+            entry = await asyncio.to_thread(self._read, key)
+        except (OSError, ValueError):
+            self._forget(key)
+            self.counters["misses"] += 1
+            return None, False
+        self._index.move_to_end(key)
+        fresh = time.time() - entry.meta.get("stored_at", 0) < self.ttl
+        self.counters["hits" if fresh else "stale"] += 1
+        return entry, fresh
+
+    def conditional_headers(self, entry):
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    async def store(self, url, text, headers, **extra):
+        if not self.is_open:
+            return
+        key = self.key_for(url)
+        meta = {
+            "url": normalize_url(url),
+            "stored_at": time.time(),
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "headers": {k: v for k, v in headers.items() if k.lower() in ("content-type", "etag", "last-modified", "cache-control")},
+            **extra,
+        }
+        try:
+            size = await asyncio.to_thread(self._write, key, meta, text)
+        except OSError as e:
+            logger.debug(f"Écriture du cache impossible pour {url}: {e}")
+            return
+        self._size += size - self._index.pop(key, 0)
+        self._index[key] = size
+        self.counters["stores"] += 1
+        self._evict()
+
+    async def refresh(self, entry, headers):
+        """Réponse 304 : l'entrée redevient fraîche, avec les nouveaux validateurs éventuels."""
+        self.counters["revalidated"] += 1
+        entry.meta["stored_at"] = time.time()
+        for header, field in (("etag", "etag"), ("last-modified", "last_modified")):
+            if headers.get(header):
+                entry.meta[field] = headers[header]
+        try:
+            await asyncio.to_thread(self._write_meta, entry.key, entry.meta)
+        except OSError as e:
+            logger.debug(f"Mise à jour du cache impossible pour {entry.meta.get('url')}: {e}")
+
+    def _forget(self, key):
+        self._size -= self._index.pop(key, 0)
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _evict(self):
+        while self._size > self.max_bytes and self._index:
+            key = next(iter(self._index))
+            self._forget(key)
+            self.counters["evictions"] += 1
+
+    def stats(self):
+        lookups = self.counters["hits"] + self.counters["misses"] + self.counters["stale"]
+        return {
+            **self.counters,
+            "entries": len(self._index),
+            "bytes": self._size,
+            "hit_ratio": round((self.counters["hits"] + self.counters["revalidated"]) / lookups, 3) if lookups else 0.0,
+        }
+
+# Partagé par toutes les tâches : les jobs quotidiens se recoupent largement. Ouvert par le
+# lifespan de main.py, ou par run_scraper en ligne de commande
+HTTP_CACHE = HttpCache()
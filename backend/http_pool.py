@@ -0,0 +1,75 @@
+import logging
+
+import httpx
+
+from host_scheduler import HOST_SCHEDULER, PoliteTransport
+
+logger = logging.getLogger(__name__)
+
+# Le HostScheduler borne déjà les requêtes simultanées (200 au total, 2 par hôte)
+HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=60.0)
+DEFAULT_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+class HttpClientPool:
+    """Client httpx (HTTP/2, file de politesse par hôte) créé une fois par process et partagé par les tâches.
+
+    Les connexions restent ouvertes `keepalive_expiry` secondes : une tâche sur des domaines déjà
+    visités réutilise les connexions TCP/TLS de la précédente. L'extension `trace` de httpcore
+    compte les connexions et poignées de main TLS réellement ouvertes.
+    """
+
+    def __init__(self, limits=HTTP_LIMITS, scheduler=HOST_SCHEDULER, transport=None):
+        self.limits = limits
+        self.scheduler = scheduler
+        self.transport = transport
+        self.client = None
+        self.counters = {"requests": 0, "https_requests": 0, "tcp_connects": 0, "tls_handshakes": 0}
+
+    async def start(self):
+        self.transport = self.transport or httpx.AsyncHTTPTransport(http2=True, verify=False, limits=self.limits)
+        self.client = httpx.AsyncClient(
+            transport=PoliteTransport(self.scheduler, self.transport),
+            follow_redirects=True,
+            headers=DEFAULT_HEADERS,
+            event_hooks={"request": [self._on_request]},
+        )
+        logger.info("Pool de connexions HTTP démarré.")
+
+    async def stop(self):
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+
+    async def _on_request(self, request):
+        self.counters["requests"] += 1
+        if request.url.scheme == "https":
+            self.counters["https_requests"] += 1
+        request.extensions["trace"] = self._trace
+
+    async def _trace(self, event_name, info):
+        if event_name == "connection.connect_tcp.complete":
+            self.counters["tcp_connects"] += 1
+        elif event_name == "connection.start_tls.complete":
+            self.counters["tls_handshakes"] += 1
+
+    def _connections(self):
+        # Pool httpcore du transport httpx : pas d'API publique pour l'inspecter
+        pool = getattr(self.transport, "_pool", None)
+        return list(getattr(pool, "connections", []))
+
+    def stats(self):
+        connections = [c for c in self._connections() if not c.is_closed()]
+        idle = sum(1 for c in connections if c.is_idle())
+        return {
+            "connections": len(connections),
+            "active": len(connections) - idle,
+            "idle": idle,
+            **self.counters,
+            "connections_reused": max(0, self.counters["requests"] - self.counters["tcp_connects"]),
+            "tls_handshakes_avoided": max(0, self.counters["https_requests"] - self.counters["tls_handshakes"]),
+            "limits": {
+                "max_connections": self.limits.max_connections,
+                "max_keepalive_connections": self.limits.max_keepalive_connections,
+                "keepalive_expiry": self.limits.keepalive_expiry,
+            },
+        }
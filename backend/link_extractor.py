@@ -0,0 +1,75 @@
+import logging
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+CONTACT_KEYWORDS = ('contact', 'mentions', 'legal', 'propos', 'about')
+
+class AnchorParser(HTMLParser):
+    """Parseur en flux qui ne retient que les balises <a href> et leur texte, sans construire d'arbre."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.anchors = []
+        self._href = None
+        self._text = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag != 'a':
+            return
+        if self._href is not None:
+            # <a> non fermé : le navigateur le referme implicitement
+            self._end_anchor()
+        for name, value in attrs:
+            if name == 'href' and value is not None:
+                self._href = value
+                self._text = []
+                break
+
+    def handle_endtag(self, tag):
+        if tag == 'a' and self._href is not None:
+            self._end_anchor()
+
+    def handle_data(self, data):
+        if self._href is not None:
+            self._text.append(data)
+
+    def _end_anchor(self):
+        self.anchors.append((self._href, "".join(self._text)))
+        self._href = None
+
+    def close(self):
+        super().close()
+        if self._href is not None:
+            self._end_anchor()
+
+def _anchors_fast(html):
+    parser = AnchorParser()
+    parser.feed(html)
+    parser.close()
+    return parser.anchors
+
+def _anchors_soup(html):
+    soup = BeautifulSoup(html, "html.parser")
+    return [(a['href'], a.text) for a in soup.find_all('a', href=True)]
+
+def iter_anchors(html):
+    """Liste des (href, texte) de la page ; BeautifulSoup n'est utilisé qu'en secours."""
+    try:
+        return _anchors_fast(html)
+    except Exception as e:
+        logger.debug(f"Parseur de liens rapide en échec, repli sur BeautifulSoup : {e}")
+        return _anchors_soup(html)
+
+def find_contact_links(html, base_url, keywords=CONTACT_KEYWORDS):
+    """Liens absolus (dédupliqués, dans l'ordre de la page) dont l'URL ou le texte évoque une page contact/mentions."""
+    links = []
+    for href, text in iter_anchors(html):
+        href_lower = href.lower()
+        text_lower = text.lower()
+        if any(k in href_lower or k in text_lower for k in keywords):
+            links.append(href if href.startswith("http") else urljoin(base_url, href))
+    return list(dict.fromkeys(links))
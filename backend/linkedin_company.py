@@ -0,0 +1,177 @@
+"""Lecture d'une page LinkedIn Company par simple requête HTTP, avant tout recours au navigateur.
+
+La page publique (non connectée) porte le nom et le site de l'entreprise dans son JSON-LD
+et dans le lien « Site web », qui passe par la redirection /redir/redirect?url=...
+"""
+import json
+import logging
+import re
+from collections import Counter
+from urllib.parse import parse_qs, urlsplit
+
+from link_extractor import iter_anchors
+from resource_blocking import TRACKER_HOSTS
+
+logger = logging.getLogger(__name__)
+
+LINKEDIN_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+    "Accept-Language": "fr-FR,fr;q=0.9,en;q=0.8",
+}
+LOGIN_WALL_PATHS = ("/authwall", "/login", "/uas/login", "/checkpoint", "/signup")
+# Statut renvoyé par LinkedIn aux clients qu'il prend pour des robots
+LINKEDIN_BLOCKED_STATUS = 999
+
+# Hôtes qui ne sont jamais le site de l'entreprise
+NON_COMPANY_HOSTS = (
+    "linkedin.com", "licdn.com", "microsoft.com", "google.com", "bing.com",
+    "facebook.com", "twitter.com", "x.com", "instagram.com", "youtube.com",
+    "w3.org", "schema.org", "ogp.me",
+    # Polices, scripts et API servis par Google
+    "gstatic.com", "googleapis.com",
+) + TRACKER_HOSTS
+# Sous-domaines de ressources statiques (CDN, images) : jamais la page d'accueil d'une entreprise
+STATIC_HOST_PREFIXES = ("cdn.", "static.", "media.", "assets.", "img.", "images.")
+
+# Une URL = tout jusqu'au premier blanc, guillemet, chevron ou antislash : un seul passage sur la page
+URL_TOKEN = re.compile(r'https?://[^\s"\'<>\\]+')
+HOST_PATTERN = re.compile(r'[a-z0-9-]+(?:\.[a-z0-9-]+)*\.[a-z]{2,}')
+
+JSON_LD_PATTERN = re.compile(r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.IGNORECASE | re.DOTALL)
+
+def _company_host(url):
+    """Nom d'hôte de `url` s'il peut être le site d'une entreprise, sinon None."""
+    try:
+        host = (urlsplit(url).hostname or "").lower()
+    except ValueError:
+        return None
+    if not HOST_PATTERN.fullmatch(host):
+        return None
+    if any(host == d or host.endswith("." + d) for d in NON_COMPANY_HOSTS):
+        return None
+    if any(host.startswith(p) or ("." + p) in host for p in STATIC_HOST_PREFIXES):
+        return None
+    return host
+
+def is_company_site(url):
+    return isinstance(url, str) and url.startswith("http") and _company_host(url) is not None
+
+def _is_link(html, start, json_ld_spans):
+    """L'URL qui commence à `start` est-elle la cible d'un lien <a href> ou une valeur du JSON-LD ?"""
+    if html[max(0, start - 6):start].lower() in ('href="', "href='") or html[max(0, start - 5):start].lower() == "href=":
+        return True
+    return any(begin <= start < end for begin, end in json_ld_spans)
+
+def rank_external_urls(html):
+    """URLs externes de la page pouvant être le site de l'entreprise, la plus probable en tête.
+
+    Temps linéaire : chaque URL est découpée une fois, puis filtrée sur son nom d'hôte.
+    Classement : hôte cible d'un lien (<a href>, redirection LinkedIn) ou cité dans le JSON-LD,
+    puis hôte le plus cité, puis chemin le plus court (page d'accueil), puis ordre d'apparition.
+    Les scripts et polices répétés ne passent donc jamais devant le lien « Site web ».
+    """
+    json_ld_spans = [match.span(1) for match in JSON_LD_PATTERN.finditer(html)]
+    candidates = {}
+    for position, match in enumerate(URL_TOKEN.finditer(html)):
+        url = match.group().split("&quot;")[0].rstrip(".,;:)]}")
+        linked = _is_link(html, match.start(), json_ld_spans)
+        target = _redirect_target(url)
+        if target:
+            url, linked = target, True
+        host = _company_host(url)
+        if host is None:
+            continue
+        depth = len(urlsplit(url).path.strip("/"))
+        candidate = candidates.setdefault(
+            host, {"url": url, "depth": depth, "count": 0, "linked": False, "position": position}
+        )
+        candidate["count"] += 1
+        candidate["linked"] = candidate["linked"] or linked
+        if depth < candidate["depth"]:
+            candidate.update(url=url, depth=depth)
+    ranked = sorted(candidates.values(), key=lambda c: (not c["linked"], -c["count"], c["depth"], c["position"]))
+    return [c["url"] for c in ranked]
+
+def _json_ld_organizations(html):
+    for block in JSON_LD_PATTERN.findall(html):
+        try:
+            data = json.loads(block)
+        except ValueError:
+            continue
+        nodes = data.get("@graph", [data]) if isinstance(data, dict) else data
+        for node in nodes if isinstance(nodes, list) else []:
+            if isinstance(node, dict) and node.get("@type") in ("Organization", "Corporation", "LocalBusiness"):
+                yield node
+
+def _redirect_target(href):
+    """Cible d'un lien /redir/redirect?url=... de LinkedIn, sinon None."""
+    if "/redir/redirect" not in href:
+        return None
+    target = parse_qs(urlsplit(href).query).get("url")
+    return target[0] if target else None
+
+def parse_company_page(html):
+    """(nom, site web) lus dans le HTML public d'une page LinkedIn Company ; chaque valeur peut être None."""
+    name = website = None
+    for org in _json_ld_organizations(html):
+        name = name or org.get("name")
+        same_as = org.get("sameAs")
+        for candidate in [org.get("url"), *(same_as if isinstance(same_as, list) else [same_as])]:
+            if is_company_site(candidate):
+                website = website or candidate
+    if not website:
+        for href, _ in iter_anchors(html):
+            target = _redirect_target(href)
+            if is_company_site(target):
+                website = target
+                break
+    return name, website
+
+def login_wall_reason(response):
+    """'login_wall' si LinkedIn a refusé la page publique (redirection vers la connexion, statut 999), sinon None."""
+    if response.status_code == LINKEDIN_BLOCKED_STATUS:
+        return "login_wall"
+    if any(response.url.path.startswith(path) for path in LOGIN_WALL_PATHS):
+        return "login_wall"
+    return None
+
+async def fetch_company_http(client, url, timeout=10):
+    """Premier niveau : GET simple. Retourne (nom, site, raison) ; `raison` explique l'échec, None si le site est trouvé."""
+    try:
+        response = await client.get(url, headers=LINKEDIN_HEADERS, timeout=timeout)
+    except Exception as e:
+        logger.debug(f"GET LinkedIn en échec ({url}): {e}")
+        return None, None, "http_error"
+    reason = login_wall_reason(response)
+    if reason:
+        return None, None, reason
+    if response.status_code != 200:
+        return None, None, "http_error"
+    name, website = parse_company_page(response.text)
+    if not website:
+        # Page tronquée servie aux visiteurs non connectés
+        return name, None, "login_wall" if "authwall" in response.text else "no_website"
+    return name, website, None
+
+class TierStats:
+    """Taux de réussite de chaque niveau de lecture des pages LinkedIn et raisons des escalades."""
+
+    def __init__(self):
+        self.attempts = Counter()
+        self.hits = Counter()
+        self.escalations = Counter()
+
+    def record(self, tier, hit, reason=None):
+        self.attempts[tier] += 1
+        self.hits[tier] += int(hit)
+        if reason:
+            self.escalations[reason] += 1
+
+    def stats(self):
+        return {
+            **{
+                tier: {"attempts": n, "hits": self.hits[tier], "hit_ratio": round(self.hits[tier] / n, 3)}
+                for tier, n in self.attempts.items()
+            },
+            "escalations": dict(self.escalations),
+        }
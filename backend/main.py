@@ -1,13 +1,31 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import StreamingResponse, FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+from typing import List
 import asyncio
 import json
 import os
 import scraper_runner
+from host_scheduler import HOST_SCHEDULER
+from http_cache import HTTP_CACHE
+from contact_store import CONTACT_STORE
+from domain_filter import DOMAIN_FILTER
 
-app = FastAPI(title="Scraper Dashboard")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Chromium est lancé une seule fois : les tâches ne paient plus son démarrage
+    HTTP_CACHE.open()
+    CONTACT_STORE.open()
+    await scraper_runner.BROWSER_POOL.start()
+    await scraper_runner.HTTP_POOL.start()
+    yield
+    await scraper_runner.HTTP_POOL.stop()
+    await scraper_runner.BROWSER_POOL.stop()
+    CONTACT_STORE.close()
+
+app = FastAPI(title="Scraper Dashboard", lifespan=lifespan)
 
 # CORS config - Allow everything for MVP
 app.add_middleware(
@@ -23,6 +41,16 @@ class StartRequest(BaseModel):
     sector: str = "Coiffeur"
     city: str = None
     limit: int = 10
+    workers: int = 5
+    detail_tabs: int = 0
+    capture_xhr: bool = False
+    grid: int = 0
+    grid_parallel: int = 3
+    # Lot : toutes les combinaisons secteur x ville dans une seule tâche
+    sectors: List[str] = []
+    cities: List[str] = []
+    batch_parallel: int = 2
+    linkedin_pages: int = 3
 
 @app.post("/api/scrape/start")
 async def start_scrape(req: StartRequest):
@@ -83,14 +111,33 @@ async def get_results(task_id: str):
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    # Simple logic: assume scraper wrote to liste_email.csv in CWD
-    file_path = "liste_email.csv"
-    if os.path.exists(file_path):
+    file_path = task.output_file
+    if file_path and os.path.exists(file_path):
         return FileResponse(file_path, media_type="text/csv", filename=f"results_{task_id}.csv")
     
     # Fallback: maybe file was not created yet or empty?
     raise HTTPException(status_code=404, detail="Results file not found (might be empty or scraped failed)")
 
+@app.get("/api/scrape/hosts")
+async def host_stats():
+    """Concurrence et attente courante par hôte (file de politesse httpx)."""
+    return HOST_SCHEDULER.snapshot()
+
+@app.get("/api/scrape/cache")
+async def cache_stats():
+    """Compteurs du cache HTTP disque (hits, misses, revalidations, évictions)."""
+    return HTTP_CACHE.stats()
+
+@app.get("/api/scrape/connections")
+async def connection_stats():
+    """Connexions du client HTTP partagé (actives, inactives) et poignées de main TLS évitées."""
+    return scraper_runner.HTTP_POOL.stats()
+
+@app.get("/api/scrape/dns")
+async def dns_stats():
+    """Filtre NXDOMAIN : verdicts servis depuis le cache, domaines inexistants écartés avant toute requête HTTP."""
+    return DOMAIN_FILTER.stats()
+
 @app.get("/api/health")
 async def health():
-    return {"status": "ok", "version": "1.0"}
+    return {"status": "ok", "version": "1.0", "browsers": scraper_runner.BROWSER_POOL.stats()}
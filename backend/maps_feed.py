@@ -0,0 +1,132 @@
+import time
+import logging
+
+from waits import CARD_SELECTOR
+
+logger = logging.getLogger(__name__)
+
+# Un seul aller-retour CDP par scroll : tout ce que la carte expose déjà dans le DOM du flux
+FEED_HARVEST_JS = """
+(selector) => Array.from(document.querySelectorAll(selector)).map((card, index) => {
+    const link = card.querySelector('a[href*="/maps/place/"]');
+    const site = card.querySelector(
+        'a[data-value="Site Web"], a[data-value="Website"], a[aria-label^="Visiter le site"], a[aria-label^="Visit"]'
+    );
+    const placeUrl = link ? link.href : null;
+    const cid = placeUrl ? placeUrl.match(/!1s(0x[0-9a-f]+:0x[0-9a-f]+)/i) : null;
+    return {
+        index,
+        name: card.getAttribute('aria-label') || (link && link.getAttribute('aria-label')) || null,
+        place_url: placeUrl,
+        website: site ? site.href : null,
+        cid: cid ? cid[1] : null,
+    };
+})
+"""
+
+async def harvest_feed(page):
+    """Cartes visibles du flux Maps : [{index, name, place_url, website, cid}] en un seul `evaluate`."""
+    try:
+        return await page.evaluate(FEED_HARVEST_JS, CARD_SELECTOR)
+    except Exception as e:
+        logger.debug(f"Lecture du flux Maps impossible : {e}")
+        return []
+
+def card_key(card):
+    """Identité stable d'une carte du flux : cid, sinon URL de la fiche, sinon nom affiché."""
+    return card.get("cid") or card.get("place_url") or card.get("name")
+
+class FeedTracker:
+    """Cartes du flux déjà traitées pendant la tâche, pour ne traiter à chaque scroll que les nouvelles."""
+
+    def __init__(self):
+        self.seen = set()
+        self.skipped_duplicates = 0
+
+    def new_cards(self, cards):
+        fresh = []
+        for card in cards:
+            key = card_key(card)
+            if key is not None and key in self.seen:
+                self.skipped_duplicates += 1
+                continue
+            if key is not None:
+                self.seen.add(key)
+            fresh.append(card)
+        return fresh
+
+    def stats(self):
+        return {"cards": len(self.seen), "skipped_duplicates": self.skipped_duplicates}
+
+END_OF_LIST_MARKERS = ("Vous êtes arrivé à la fin de la liste", "You've reached the end of the list")
+
+# Le message de fin est le dernier élément du flux : inutile de lire tout son texte
+END_OF_LIST_JS = """
+(markers) => {
+    const feed = document.querySelector('div[role="feed"]');
+    if (!feed) return false;
+    const tail = Array.from(feed.children).slice(-3).map(el => el.textContent || '').join(' ');
+    return markers.some(marker => tail.includes(marker));
+}
+"""
+
+async def feed_ended(page):
+    """True si le flux Maps affiche le message de fin de liste."""
+    try:
+        return await page.evaluate(END_OF_LIST_JS, list(END_OF_LIST_MARKERS))
+    except Exception:
+        return False
+
+class ScrollController:
+    """Décide après chaque scroll s'il faut continuer à faire défiler le flux Maps.
+
+    Arrêt sur le message de fin de liste, après `max_stalls` scrolls sans nouvelle carte,
+    ou quand le budget (`max_scrolls`, `max_seconds`) est épuisé.
+    """
+
+    def __init__(self, max_stalls=3, max_scrolls=200, max_seconds=600):
+        self.max_stalls = max_stalls
+        self.max_scrolls = max_scrolls
+        self.max_seconds = max_seconds
+        self.started = time.monotonic()
+        self.scrolls = 0
+        self.stalls = 0
+        self.cards = 0
+        self.stop_reason = None
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    @property
+    def cards_per_second(self):
+        return self.cards / self.elapsed if self.elapsed > 0 else 0.0
+
+    def should_continue(self, new_cards, end_reached):
+        """`new_cards` : cartes apparues depuis le scroll précédent."""
+        self.scrolls += 1
+        self.cards += new_cards
+        self.stalls = 0 if new_cards else self.stalls + 1
+
+        if end_reached:
+            self.stop_reason = "end_of_list"
+        elif self.stalls >= self.max_stalls:
+            self.stop_reason = "stalled"
+        elif self.scrolls >= self.max_scrolls:
+            self.stop_reason = "scroll_budget"
+        elif self.elapsed >= self.max_seconds:
+            self.stop_reason = "time_budget"
+
+        if self.stop_reason:
+            logger.info(f"Fin du défilement ({self.stop_reason}) : {self.cards} cartes en {self.scrolls} scrolls, {self.cards_per_second:.1f} cartes/s")
+        elif self.scrolls % 5 == 0:
+            logger.info(f"Flux Maps : {self.cards} cartes après {self.scrolls} scrolls ({self.cards_per_second:.1f} cartes/s)")
+        return self.stop_reason is None
+
+    def stats(self):
+        return {
+            "scrolls": self.scrolls,
+            "cards": self.cards,
+            "cards_per_second": round(self.cards_per_second, 2),
+            "stop_reason": self.stop_reason,
+        }
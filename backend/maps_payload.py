@@ -0,0 +1,164 @@
+"""Lecture des réponses XHR de Google Maps (recherche et fiches) sans cliquer sur les cartes.
+
+Vérification hors ligne sur des réponses sauvegardées :
+
+    python maps_payload.py fixtures/maps_search_payload.txt
+"""
+import asyncio
+import json
+import re
+import sys
+import logging
+from urllib.parse import parse_qs, unquote, urlsplit
+
+logger = logging.getLogger(__name__)
+
+XSSI_PREFIX = ")]}'"
+PAYLOAD_URL_MARKERS = ("/search?tbm=map", "/maps/preview/place", "/maps/search/")
+CID_PATTERN = re.compile(r'^0x[0-9a-f]+:0x[0-9a-f]+$', re.IGNORECASE)
+
+def _strip_payload(text):
+    text = text.strip()
+    if text.endswith('/*""*/'):
+        text = text[:-len('/*""*/')].rstrip()
+    if text.startswith(XSSI_PREFIX):
+        text = text[len(XSSI_PREFIX):].lstrip()
+    return text
+
+def decode_payload(text):
+    """JSON d'une réponse Maps : préfixe anti-XSSI retiré, enveloppe {"c":..,"d":"..."} dépliée."""
+    data = json.loads(_strip_payload(text))
+    if isinstance(data, dict) and isinstance(data.get("d"), str):
+        data = json.loads(_strip_payload(data["d"]))
+    return data
+
+def _dig(node, *path):
+    for key in path:
+        if not isinstance(node, list) or key >= len(node):
+            return None
+        node = node[key]
+    return node
+
+def _clean_website(url):
+    """Les sites passent parfois par une redirection Google /url?q=..."""
+    if not isinstance(url, str) or not url:
+        return None
+    if url.startswith("/url?") or "google.com/url?" in url:
+        target = parse_qs(urlsplit(url).query).get("q")
+        url = unquote(target[0]) if target else None
+    return url if url and url.startswith("http") else None
+
+def _is_place(node):
+    return (
+        isinstance(node, list)
+        and len(node) > 11
+        and isinstance(node[11], str)
+        and isinstance(node[10], str)
+        and bool(CID_PATTERN.match(node[10]))
+    )
+
+def _to_record(place):
+    phone = _dig(place, 178, 0, 0)
+    return {
+        "name": place[11],
+        "website": _clean_website(_dig(place, 7, 0)),
+        "telephone": phone if isinstance(phone, str) else None,
+        "cid": place[10],
+    }
+
+def parse_listings(data):
+    """Fiches trouvées dans un payload décodé : [{name, website, telephone, cid}], sans doublon de cid."""
+    records = []
+    seen = set()
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, list):
+            continue
+        if _is_place(node):
+            if node[10] not in seen:
+                seen.add(node[10])
+                records.append(_to_record(node))
+            continue
+        stack.extend(reversed(node))
+    return records
+
+def parse_payload(text):
+    try:
+        return parse_listings(decode_payload(text))
+    except ValueError as e:
+        logger.debug(f"Payload Maps illisible : {e}")
+        return []
+
+class MapsXhrCapture:
+    """Écoute les réponses réseau d'une page Maps et transmet les fiches au pipeline.
+
+    `seen_cids` / `seen_names` permettent au parcours par clic de ne traiter que les cartes
+    absentes des payloads. Seules les fiches transmises avec un site y entrent : une fiche sans
+    site (ou lue aux mauvais index si Maps change son format) reste à cliquer.
+    """
+
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+        self.seen_cids = set()
+        self.seen_names = set()
+        self.payloads = 0
+        self.without_website = 0
+        self._tasks = set()
+
+    def attach(self, page):
+        page.on("response", self._on_response)
+
+    def _on_response(self, response):
+        if not any(marker in response.url for marker in PAYLOAD_URL_MARKERS):
+            return
+        task = asyncio.create_task(self._consume(response))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _consume(self, response):
+        try:
+            text = await response.text()
+        except Exception as e:
+            logger.debug(f"Corps XHR Maps indisponible ({response.url}): {e}")
+            return
+        records = parse_payload(text)
+        if not records:
+            return
+        self.payloads += 1
+        for record in records:
+            if record["cid"] in self.seen_cids:
+                continue
+            if not record["website"]:
+                self.without_website += 1
+                continue
+            self.seen_cids.add(record["cid"])
+            self.seen_names.add(record["name"])
+            await self.pipeline.submit(record["name"], record["website"], record["telephone"])
+
+    def knows(self, card):
+        """La carte a-t-elle déjà été lue dans un payload ? Le nom ne sert que si la carte n'a pas de cid."""
+        if card.get("cid"):
+            return card["cid"] in self.seen_cids
+        return card.get("name") in self.seen_names
+
+    async def settle(self):
+        """Attend le traitement des réponses déjà reçues."""
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def close(self):
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def stats(self):
+        return {"payloads": self.payloads, "places": len(self.seen_cids), "without_website": self.without_website}
+
+if __name__ == "__main__":
+    for path in sys.argv[1:]:
+        with open(path, encoding="utf-8") as f:
+            listings = parse_payload(f.read())
+        print(f"{path} : {len(listings)} fiches")
+        for listing in listings:
+            print(f"  {listing['name']} | {listing['website']} | {listing['telephone']} | {listing['cid']}")
@@ -1,18 +1,45 @@
 import asyncio
-import csv
-import re
+import itertools
+import time
 import logging
 import argparse
-from playwright.async_api import async_playwright
 import httpx
-from bs4 import BeautifulSoup
 from tenacity import retry, stop_after_attempt, wait_exponential
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from http_pool import HttpClientPool
+from result_sink import CsvResultSink
+from http_cache import HTTP_CACHE
+from contact_store import CONTACT_STORE
+from domain_filter import DOMAIN_FILTER
+from contact_scanner import IncrementalScanner, normalize_phone, scan_contacts
+from link_extractor import find_contact_links
+from resource_blocking import ResourcePolicy
+from browser_pool import BrowserPool
+from maps_feed import FeedTracker, ScrollController, feed_ended, harvest_feed
+from maps_payload import MapsXhrCapture
+from ddg_search import search_linkedin_companies
+from linkedin_company import TierStats, fetch_company_http, is_company_site, rank_external_urls
+from geo_grid import VIEWPORT_PATTERN, grid_shards, maps_search_url, parse_viewport
+from waits import CARD_SELECTOR, PLACE_TITLE_SELECTOR, WaitMetrics, timed_wait, wait_for_card_growth, wait_for_title_change
 
 # Configuration par défaut
 DEFAULT_SECTOR = "Coiffeur"
 DEFAULT_CITY = "Bordeaux"
 DEFAULT_GOAL = 3
+DEFAULT_WORKERS = 5
+DEFAULT_GRID_PARALLEL = 3
+DEFAULT_BATCH_PARALLEL = 2
+# Toutes les pages LinkedIn ne mènent pas à un email : on en cherche plus que l'objectif
+LINKEDIN_CANDIDATES_PER_RESULT = 3
+DEFAULT_LINKEDIN_PAGES = 3
 OUTPUT_FILE = "liste_email.csv"
+MAX_BODY_BYTES = 2 * 1024 * 1024
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+CONTEXT_OPTIONS = {
+    "viewport": {'width': 1280, 'height': 800},
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+    "locale": "fr-FR",
+}
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 logger = logging.getLogger(__name__)
@@ -35,74 +62,105 @@ class QueueLogger(logging.Handler):
         except Exception:
             self.handleError(record)
 
-EMAIL_REGEX = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-PHONE_REGEX = r'(?:(?:\+|00)33|0)[1-9](?:[\s.-]*\d{2}){4}'
+async def fetch_page(client, url, timeout, result=None, max_bytes=MAX_BODY_BYTES):
+    """GET d'une page HTML via le cache disque (servie localement si fraîche, sinon revalidée).
+
+    Le corps est lu en streaming et, si `result` est fourni, analysé au fil de l'eau : le transfert
+    est interrompu dès que l'email et le téléphone sont connus, ou après `max_bytes` octets.
+    Retourne le texte lu, ou None si la réponse n'est pas une page HTML/texte.
+    """
+    entry, fresh = await HTTP_CACHE.lookup(url)
+    if fresh:
+        if result is not None:
+            scan_contacts(entry.text, result)
+        return entry.text
+
+    headers = HTTP_CACHE.conditional_headers(entry) if entry else {}
+    async with client.stream("GET", url, timeout=timeout, follow_redirects=True, headers=headers) as response:
+        if entry and response.status_code == 304:
+            await HTTP_CACHE.refresh(entry, response.headers)
+            if result is not None:
+                scan_contacts(entry.text, result)
+            return entry.text
+        response.raise_for_status()
+
+        content_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+        if content_type and content_type not in HTML_CONTENT_TYPES:
+            logger.info(f"Contenu ignoré ({content_type}) : {url}")
+            return None
+
+        scanner = IncrementalScanner(result) if result is not None else None
+        chunks = []
+        received = 0
+        truncated = False
+        async for chunk in response.aiter_text():
+            chunks.append(chunk)
+            received += len(chunk)
+            if scanner and scanner.feed(chunk):
+                truncated = True
+                break
+            if max(received, response.num_bytes_downloaded) >= max_bytes:
+                logger.info(f"Page tronquée à {max_bytes} octets : {url}")
+                truncated = True
+                break
+        if scanner and not scanner.complete:
+            scanner.close()
+
+    text = "".join(chunks)
+    if not truncated:
+        # Un corps interrompu ne doit jamais être resservi (ni revalidé par 304) comme la page entière
+        await HTTP_CACHE.store(url, text, response.headers)
+    return text
+
+async def fetch_contact_subpages(client, links, result):
+    """Visite les pages contact/mentions en parallèle ; annule les requêtes restantes dès que tout est trouvé."""
+    tasks = [asyncio.create_task(fetch_page(client, link, timeout=15.0, result=result)) for link in links]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                await next_done
+            except Exception:
+                continue
+            if result["email"] and result["telephone"]:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
 async def extract_contact_info_from_website(client, url):
-    """Tente d'extraire un email et un téléphone d'un site web via httpx."""
+    """Tente d'extraire un email et un téléphone d'un site web via httpx.
+
+    Retourne None si la page d'accueil n'a pas pu être lue pour une raison passagère (timeout,
+    connexion coupée, erreur 5xx) : ce résultat ne dit rien des contacts du site.
+    """
     if not url or not url.startswith("http"):
         return {"email": None, "telephone": None}
     
     result = {"email": None, "telephone": None}
+    logger.info(f"Visiting website: {url}")
     try:
-        logger.info(f"Visiting website: {url}")
-        response = await client.get(url, timeout=20.0, follow_redirects=True)
-        response.raise_for_status()
-        
-        # Extract Email
-        emails = re.findall(EMAIL_REGEX, response.text)
-        valid_emails = [e for e in emails if not e.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp'))]
-        if valid_emails:
-            result["email"] = valid_emails[0].rstrip('.')
-        
-        # Extract Phone
-        phones = re.findall(PHONE_REGEX, response.text)
-        if phones:
-            result["telephone"] = phones[0].replace(' ', '').replace('.', '').replace('-', '')
-
-        if result["email"] and result["telephone"]:
+        html = await fetch_page(client, url, timeout=20.0, result=result)
+    except Exception as e:
+        logger.warning(f"Could not scrape {url}: {e}")
+        # Un 4xx est une réponse du site (pas de page lisible) ; le reste est un échec passager
+        if isinstance(e, httpx.HTTPStatusError) and e.response.status_code < 500:
             return result
+        return None
+    if html is None or (result["email"] and result["telephone"]):
+        return result
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        contact_links = []
-        for a in soup.find_all('a', href=True):
-            href = a['href'].lower()
-            text = a.text.lower()
-            if any(k in href or k in text for k in ['contact', 'mentions', 'legal', 'propos', 'about']):
-                link = a['href']
-                if not link.startswith("http"):
-                    from urllib.parse import urljoin
-                    link = urljoin(url, link)
-                contact_links.append(link)
-        
-        for link in list(set(contact_links))[:3]:
-            try:
-                sub_res = await client.get(link, timeout=15.0, follow_redirects=True)
-                
-                if not result["email"]:
-                    emails = re.findall(EMAIL_REGEX, sub_res.text)
-                    valid_emails = [e for e in emails if not e.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp'))]
-                    if valid_emails:
-                        result["email"] = valid_emails[0].rstrip('.')
-                
-                if not result["telephone"]:
-                    phones = re.findall(PHONE_REGEX, sub_res.text)
-                    if phones:
-                        result["telephone"] = phones[0].replace(' ', '').replace('.', '').replace('-', '')
-                
-                if result["email"] and result["telephone"]:
-                    break
-            except:
-                continue
+    try:
+        contact_links = find_contact_links(html, url)
+        await fetch_contact_subpages(client, contact_links[:3], result)
                 
     except Exception as e:
         logger.warning(f"Could not scrape {url}: {e}")
     return result
 
-async def handle_cookies(page):
+async def handle_cookies(page, metrics=None):
     """Gère le bouton de refus des cookies de Google."""
     try:
-        await asyncio.sleep(2)
         reject_selectors = [
             'button:has-text("Tout refuser")',
             'button:has-text("Reject all")',
@@ -110,19 +168,583 @@ async def handle_cookies(page):
             'button[aria-label="Reject all"]',
             'div[role="none"] button:nth-child(1)'
         ]
+        # Attend que la page affiche soit la bannière de consentement, soit directement les résultats
+        ready = page.locator(", ".join(reject_selectors[:4] + ['div[role="feed"]', 'div[role="main"]']))
+        await timed_wait(metrics, "page_ready", ready.first.wait_for(timeout=8000))
         for selector in reject_selectors:
             btn = page.locator(selector)
             if await btn.count() > 0:
                 logger.info(f"Refusing cookies with: {selector}")
                 await btn.first.scroll_into_view_if_needed()
                 await btn.first.click()
-                await asyncio.sleep(2)
+                await timed_wait(metrics, "cookies_dismissed", btn.first.wait_for(state="detached", timeout=5000))
                 return True
     except Exception as e:
         logger.debug(f"Cookie rejection failed: {e}")
     return False
 
-async def run_scraper(args, queue=None):
+class EnrichmentPipeline:
+    """File bornée entre la découverte (Maps/LinkedIn) et un pool de workers d'enrichissement.
+
+    La découverte appelle `submit()`, qui bloque quand la file est pleine (backpressure).
+    Dès que `limit` emails sont trouvés, `limit_reached` est levé et les workers en cours
+    sont annulés à la fermeture.
+    """
+
+    def __init__(self, client, limit, workers=DEFAULT_WORKERS, on_result=None, store=None, processed_websites=None, domain_filter=None):
+        self.client = client
+        self.limit = limit
+        self.workers = max(1, workers)
+        self.on_result = on_result
+        self.store = store
+        self.domain_filter = domain_filter
+        self.queue = asyncio.Queue(maxsize=self.workers * 2)
+        self.limit_reached = asyncio.Event()
+        self.results = []
+        # Partageable entre pipelines d'un même lot pour ne traiter chaque site qu'une fois
+        self.processed_websites = processed_websites if processed_websites is not None else set()
+        self._tasks = []
+
+    @property
+    def found(self):
+        return len(self.results)
+
+    async def __aenter__(self):
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None and not self.limit_reached.is_set():
+                await self._drain()
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _drain(self):
+        """Attend la fin des sites en file, ou l'objectif atteint (les requêtes restantes sont abandonnées)."""
+        for _ in self._tasks:
+            await self.queue.put(None)
+        drained = asyncio.gather(*self._tasks, return_exceptions=True)
+        limit_wait = asyncio.create_task(self.limit_reached.wait())
+        try:
+            await asyncio.wait({drained, limit_wait}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            limit_wait.cancel()
+
+    async def submit(self, nom, website, telephone=None):
+        """Met une entreprise en file d'enrichissement. Retourne False si elle est ignorée.
+
+        `telephone` (déjà connu par la source) sert si le site n'en donne pas.
+        """
+        if self.limit_reached.is_set() or not website or website in self.processed_websites:
+            return False
+        self.processed_websites.add(website)
+        if self.domain_filter:
+            # L'existence du domaine est vérifiée pendant que le site attend son tour dans la file
+            self.domain_filter.prefetch(website)
+        await self.queue.put((nom, website, telephone))
+        return True
+
+    async def _worker(self):
+        while True:
+            item = await self.queue.get()
+            try:
+                if item is None:
+                    return
+                if not self.limit_reached.is_set():
+                    await self._enrich(*item)
+            except Exception as e:
+                logger.warning(f"Erreur d'enrichissement ({item[0]}): {e}")
+            finally:
+                self.queue.task_done()
+
+    async def _enrich(self, nom, website, telephone=None):
+        contacts = await self.store.get(website) if self.store else None
+        if contacts is None:
+            if self.domain_filter and not await self.domain_filter.exists(website):
+                logger.info(f"Domaine inexistant, site ignoré : {website}")
+                contacts = {"email": None, "telephone": None}
+            else:
+                contacts = await extract_contact_info_from_website(self.client, website)
+                if contacts is None:
+                    # Échec passager : rien n'est mémorisé, le site sera retenté à la prochaine tâche
+                    return
+            if self.store:
+                await self.store.put(website, contacts)
+        else:
+            logger.info(f"Contacts déjà connus pour {website}")
+        if not contacts["email"] or self.limit_reached.is_set():
+            return
+        row = {
+            "nom": nom,
+            "website": website,
+            "email": contacts["email"],
+            "telephone": contacts["telephone"] or (normalize_phone(telephone) if telephone else None),
+        }
+        self.results.append(row)
+        if self.on_result:
+            self.on_result(row)
+        if self.found >= self.limit:
+            self.limit_reached.set()
+
+async def read_place_details(page):
+    """Nom et site web de la fiche Maps affichée dans `page` (nom None si aucune fiche)."""
+    nom_elem = page.locator(PLACE_TITLE_SELECTOR)
+    if await nom_elem.count() == 0:
+        return None, ""
+    nom = await nom_elem.first.text_content()
+
+    website_locator = page.locator('a[data-item-id="authority"]')
+    website = ""
+    if await website_locator.count() > 0:
+        website = await website_locator.first.get_attribute("href")
+    return nom, website
+
+async def scroll_feed(page, feed_selector, metrics=None):
+    """Fait défiler le flux et attend l'arrivée de nouvelles cartes (3 s au plus)."""
+    previous_count = await page.locator(CARD_SELECTOR).count()
+    try:
+        await page.locator(feed_selector).evaluate("el => el.scrollTop += 2000")
+    except:
+        await page.mouse.wheel(0, 2000)
+    await wait_for_card_growth(page, previous_count, metrics)
+
+async def discover_maps(page, search_query, pipeline, detail_tabs=0, metrics=None, capture_xhr=False,
+                        search_url=None, tracker=None, capture=None):
+    """Parcourt le flux Google Maps et alimente le pipeline. Retourne False si le flux est introuvable.
+
+    Avec `detail_tabs` > 0, les fiches sont ouvertes dans autant d'onglets en parallèle au lieu
+    d'être cliquées une à une dans la page du flux. Avec `capture_xhr`, les fiches sont lues
+    dans les réponses réseau de Maps et seules les cartes absentes de ces réponses sont ouvertes.
+    `tracker` et `capture` peuvent être partagés entre plusieurs recherches (cases d'une grille) :
+    c'est alors à l'appelant d'attacher la capture à la page et de les clore.
+    """
+    own_capture = capture is None and capture_xhr
+    if own_capture:
+        capture = MapsXhrCapture(pipeline)
+        capture.attach(page)
+    own_tracker = tracker is None
+    tracker = tracker or FeedTracker()
+    scroll = ScrollController()
+    try:
+        return await browse_maps_feed(
+            page, search_url or maps_search_url(search_query), pipeline, detail_tabs, metrics, capture, tracker, scroll
+        )
+    finally:
+        if own_tracker:
+            logger.info(f"Cartes du flux : {tracker.stats()}")
+        logger.info(f"Défilement du flux : {scroll.stats()}")
+        if own_capture:
+            if not pipeline.limit_reached.is_set():
+                await capture.settle()
+            await capture.close()
+            logger.info(f"Réponses Maps interceptées : {capture.stats()}")
+
+async def browse_maps_feed(page, url, pipeline, detail_tabs, metrics, capture, tracker, scroll):
+    await page.goto(url)
+    await handle_cookies(page, metrics)
+
+    feed_selectors = ['div[role="feed"]', 'div[aria-label^="Résultats pour"]', 'div.m67q6026', 'div[role="main"]']
+    feed_selector = None
+    for selector in feed_selectors:
+        try:
+            await page.wait_for_selector(selector, timeout=8000)
+            feed_selector = selector
+            break
+        except:
+            continue
+
+    if not feed_selector:
+        logger.error("Impossible de trouver le flux de résultats.")
+        return False
+
+    if detail_tabs > 0:
+        await discover_maps_in_tabs(page, feed_selector, pipeline, detail_tabs, metrics, capture, tracker, scroll)
+        return True
+
+    while not pipeline.limit_reached.is_set():
+        await scroll_feed(page, feed_selector, metrics)
+        if capture:
+            await capture.settle()
+
+        # Seules les cartes apparues depuis le scroll précédent sont traitées
+        cards = tracker.new_cards(await harvest_feed(page))
+        for card in cards:
+            if pipeline.limit_reached.is_set():
+                break
+            try:
+                if capture and capture.knows(card):
+                    continue
+                if card["name"] and card["website"]:
+                    # Tout est déjà dans la carte : pas de clic
+                    await pipeline.submit(card["name"], card["website"])
+                    continue
+
+                title = page.locator(PLACE_TITLE_SELECTOR)
+                previous_title = await title.first.text_content() if await title.count() > 0 else None
+                await page.locator(CARD_SELECTOR).nth(card["index"]).click()
+                await wait_for_title_change(page, previous_title, metrics)
+
+                nom, website = await read_place_details(page)
+                if not nom: continue
+
+                await pipeline.submit(nom, website)
+            except:
+                continue
+
+        if not scroll.should_continue(len(cards), await feed_ended(page)):
+            break
+    return True
+
+async def discover_maps_in_tabs(page, feed_selector, pipeline, tabs, metrics=None, capture=None, tracker=None, scroll=None):
+    """Collecte les URLs des fiches du flux et ouvre dans un pool d'onglets celles dont la carte n'indique pas le site.
+
+    Les fiches sont transmises au pipeline dans l'ordre du flux, quel que soit l'onglet qui finit en premier.
+    """
+    place_queue = asyncio.Queue()
+    details = {}
+    next_index = 0
+    submit_lock = asyncio.Lock()
+
+    async def submit_in_feed_order():
+        nonlocal next_index
+        async with submit_lock:
+            while next_index in details:
+                nom, website = details.pop(next_index)
+                next_index += 1
+                if nom:
+                    await pipeline.submit(nom, website)
+
+    failed_tabs = 0
+
+    async def tab_worker():
+        nonlocal failed_tabs
+        try:
+            tab = await page.context.new_page()
+        except Exception as e:
+            failed_tabs += 1
+            logger.warning(f"Impossible d'ouvrir un onglet de fiches Maps : {e}")
+            if failed_tabs < tabs:
+                # Les autres onglets prennent les fiches
+                return
+            # Aucun onglet : les fiches en file sont écartées pour que la file se vide quand même
+            tab = None
+        try:
+            while True:
+                index, place_url = await place_queue.get()
+                try:
+                    if tab is None or pipeline.limit_reached.is_set():
+                        details[index] = (None, "")
+                    else:
+                        await tab.goto(place_url, timeout=15000)
+                        await timed_wait(metrics, "maps_place_tab", tab.wait_for_selector(PLACE_TITLE_SELECTOR, timeout=8000))
+                        details[index] = await read_place_details(tab)
+                except Exception as e:
+                    logger.debug(f"Fiche Maps illisible ({place_url}): {e}")
+                    details[index] = (None, "")
+                try:
+                    await submit_in_feed_order()
+                finally:
+                    place_queue.task_done()
+        finally:
+            if tab:
+                await tab.close()
+
+    workers = [asyncio.create_task(tab_worker()) for _ in range(tabs)]
+    tracker = tracker or FeedTracker()
+    scroll = scroll or ScrollController()
+    feed_index = 0
+    try:
+        while not pipeline.limit_reached.is_set():
+            await scroll_feed(page, feed_selector, metrics)
+            if capture:
+                await capture.settle()
+
+            cards = tracker.new_cards(await harvest_feed(page))
+            for card in cards:
+                place_url = card["place_url"]
+                if not place_url or (capture and capture.knows(card)):
+                    continue
+                index = feed_index
+                feed_index += 1
+                if card["name"] and card["website"]:
+                    details[index] = (card["name"], card["website"])
+                else:
+                    place_queue.put_nowait((index, place_url))
+            await submit_in_feed_order()
+
+            if not scroll.should_continue(len(cards), await feed_ended(page)):
+                break
+
+        # Laisse les onglets terminer les fiches déjà collectées, sauf si l'objectif est atteint
+        done_waiter = asyncio.create_task(place_queue.join())
+        limit_waiter = asyncio.create_task(pipeline.limit_reached.wait())
+        await asyncio.wait({done_waiter, limit_waiter}, return_when=asyncio.FIRST_COMPLETED)
+        done_waiter.cancel()
+        limit_waiter.cancel()
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+async def locate_city(page, city, metrics=None):
+    """(lat, lng, zoom) de la vue Maps d'une ville, lus dans l'URL réécrite par Maps après la recherche."""
+    await page.goto(maps_search_url(city))
+    await handle_cookies(page, metrics)
+    await timed_wait(metrics, "maps_viewport", page.wait_for_url(VIEWPORT_PATTERN, timeout=10000))
+    return parse_viewport(page.url)
+
+async def discover_maps_sharded(page, browser_pool, search_query, city, pipeline, grid_size, parallel=3,
+                                detail_tabs=0, metrics=None, capture_xhr=False, policy=None, queue=None):
+    """Découpe la ville en `grid_size` x `grid_size` recherches Maps explorées par `parallel` pages à la fois.
+
+    La page de la tâche explore elle-même les cases ; les autres pages viennent du pool quand il
+    a des contextes libres, si bien qu'un pool saturé ralentit la grille sans la bloquer.
+    Cartes et fiches XHR sont dédupliquées entre cases, la progression part sur la file SSE
+    (événements `shard`). Retourne False si aucune case n'a de flux.
+    """
+    centre = await locate_city(page, city, metrics)
+    if not centre:
+        logger.warning(f"Centre de la carte introuvable pour '{city}' : recherche unique.")
+        return await discover_maps(page, search_query, pipeline, detail_tabs, metrics, capture_xhr=capture_xhr)
+
+    viewport = CONTEXT_OPTIONS["viewport"]
+    shards = grid_shards(*centre, grid_size, viewport=(viewport["width"], viewport["height"]))
+    logger.info(f"Grille {grid_size}x{grid_size} autour de {centre[0]:.4f},{centre[1]:.4f} (zoom {shards[0][2]:g})")
+    pending = list(enumerate(shards))
+    tracker = FeedTracker()
+    capture = MapsXhrCapture(pipeline) if capture_xhr else None
+    feeds_found = []
+
+    def report(index, status, **data):
+        if queue:
+            queue.put_nowait({"type": "shard", "data": {"index": index, "total": len(shards), "status": status, **data}})
+
+    async def explore(shard_page):
+        if capture:
+            capture.attach(shard_page)
+        while pending and not pipeline.limit_reached.is_set():
+            index, (lat, lng, zoom) = pending.pop(0)
+            report(index, "started", lat=round(lat, 6), lng=round(lng, 6), zoom=zoom)
+            try:
+                feed_found = await discover_maps(
+                    shard_page, search_query, pipeline, detail_tabs, metrics,
+                    search_url=maps_search_url(search_query, lat, lng, zoom), tracker=tracker, capture=capture,
+                )
+                # Les réponses XHR de la case doivent être lues avant que la page ne change ou ne ferme
+                if capture and not pipeline.limit_reached.is_set():
+                    await capture.settle()
+            except Exception as e:
+                logger.error(f"Case {index + 1}/{len(shards)} de la grille en échec : {e}")
+                report(index, "error", message=str(e))
+                continue
+            feeds_found.append(feed_found)
+            report(index, "done", feed_found=feed_found, cards=len(tracker.seen), results=len(pipeline.results))
+
+    busy = set()
+
+    async def pooled_explorer():
+        async with browser_pool.context(**CONTEXT_OPTIONS) as context:
+            if not pending:
+                return
+            busy.add(asyncio.current_task())
+            if policy:
+                await policy.install(context)
+            await explore(await context.new_page())
+
+    helpers = [asyncio.create_task(pooled_explorer()) for _ in range(parallel - 1)]
+    try:
+        await explore(page)
+        # Les pages encore en attente d'un contexte n'ont plus de case à prendre
+        for helper in helpers:
+            if helper not in busy:
+                helper.cancel()
+        await asyncio.gather(*helpers, return_exceptions=True)
+    finally:
+        for helper in helpers:
+            helper.cancel()
+        await asyncio.gather(*helpers, return_exceptions=True)
+        for shard_index, _ in pending:
+            report(shard_index, "skipped")
+        logger.info(f"Cartes de la grille : {tracker.stats()}")
+        if capture:
+            await capture.close()
+            logger.info(f"Réponses Maps interceptées : {capture.stats()}")
+    return any(feeds_found)
+
+async def discover_linkedin(page, search_query, pipeline, metrics=None, pages=DEFAULT_LINKEDIN_PAGES):
+    """Trouve des pages LinkedIn Company via DuckDuckGo puis alimente le pipeline avec leur site web.
+
+    Les pages de résultats arrivent en tâche de fond : chaque page LinkedIn est visitée dès
+    qu'elle est connue, par `pages` onglets à la fois, arrêtés dès que l'objectif est atteint.
+    """
+    query = f"linkedin company {search_query}"
+    logger.info(f"Recherche LinkedIn via DuckDuckGo HTML : '{query}'")
+
+    candidates = asyncio.Queue()
+
+    async def search():
+        found = 0
+        try:
+            async for url, title in search_linkedin_companies(
+                pipeline.client, query, pipeline.limit * LINKEDIN_CANDIDATES_PER_RESULT, stop=pipeline.limit_reached
+            ):
+                logger.info(f"LinkedIn Company trouvée : {title} -> {url}")
+                found += 1
+                await candidates.put((url, title))
+        finally:
+            logger.info(f"{found} pages LinkedIn Company trouvées.")
+            candidates.put_nowait(None)
+
+    async def visitor(visit_page):
+        while (item := await candidates.get()) is not None:
+            await visit_linkedin_company(visit_page, *item, pipeline, metrics, tiers)
+        # Fin de la recherche : le marqueur reste en file pour les autres onglets
+        candidates.put_nowait(None)
+
+    async def pooled_visitor():
+        tab = await page.context.new_page()
+        try:
+            await visitor(tab)
+        finally:
+            await tab.close()
+
+    tiers = TierStats()
+    searcher = asyncio.create_task(search())
+    visitors = [asyncio.create_task(visitor(page))]
+    visitors += [asyncio.create_task(pooled_visitor()) for _ in range(pages - 1)]
+    visits_done = asyncio.gather(*visitors, return_exceptions=True)
+    limit_waiter = asyncio.create_task(pipeline.limit_reached.wait())
+    try:
+        await asyncio.wait({visits_done, limit_waiter}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in (searcher, limit_waiter, *visitors):
+            task.cancel()
+        await asyncio.gather(searcher, limit_waiter, visits_done, return_exceptions=True)
+        logger.info(f"Lecture des pages LinkedIn : {tiers.stats()}")
+    return True
+
+async def visit_linkedin_company(page, href, title, pipeline, metrics=None, tiers=None):
+    """Lit le nom et le site web d'une page LinkedIn Company et transmet l'entreprise au pipeline.
+
+    Un GET simple suffit quand la page publique donne le site ; le navigateur ne sert que
+    si LinkedIn impose sa page de connexion ou si le site n'apparaît pas dans le HTML.
+    """
+    if pipeline.limit_reached.is_set():
+        return
+    nom = title.split(" |")[0].split(" -")[0].strip()  # Nettoyage du titre
+
+    started = time.monotonic()
+    page_nom, website, reason = await fetch_company_http(pipeline.client, href)
+    if metrics:
+        metrics.record("linkedin_http", time.monotonic() - started, False)
+    if tiers:
+        tiers.record("http", website is not None, reason)
+    if website:
+        nom = page_nom or nom
+        logger.info(f"Site web trouvé pour {nom} : {website} (HTTP)")
+        await pipeline.submit(nom, website)
+        return
+    if pipeline.limit_reached.is_set():
+        return
+
+    started = time.monotonic()
+    timed_out = False
+    try:
+        # Visite la page LinkedIn Company avec Playwright
+        logger.info(f"Visite de la page LinkedIn ({reason}) : {href}")
+        await page.goto(href, timeout=15000)
+        await timed_wait(metrics, "linkedin_page", page.locator('h1').first.wait_for(timeout=5000))
+
+        # Extraction du nom depuis la page (plus fiable)
+        nom_elem = page.locator('h1')
+        if await nom_elem.count() > 0:
+            page_nom = await nom_elem.first.text_content()
+            if page_nom and page_nom.strip():
+                nom = page_nom.strip()
+
+        # Extraction du site web depuis LinkedIn
+        # Chercher les liens externes (hôte hors LinkedIn, réseaux sociaux, CDN)
+        all_links = await page.locator('a[href^="http"]').all()
+        for a_link in all_links:
+            a_href = await a_link.get_attribute("href")
+            if is_company_site(a_href):
+                a_text = await a_link.text_content() or ""
+                if any(kw in a_text.lower() for kw in ["site", "website", "visiter", "visit"]):
+                    website = a_href
+                    break
+
+        # Si pas trouvé via le texte, chercher dans le HTML brut
+        if not website:
+            ext_urls = rank_external_urls(await page.content())
+            if ext_urls:
+                website = ext_urls[0]
+
+        if website:
+            logger.info(f"Site web trouvé pour {nom} : {website}")
+        else:
+            logger.warning(f"Aucun site web trouvé pour {nom}")
+    except Exception as e:
+        timed_out = isinstance(e, PlaywrightTimeoutError)
+        logger.warning(f"Erreur sur LinkedIn ({nom}): {e}")
+        return
+    finally:
+        if metrics:
+            metrics.record("linkedin_visit", time.monotonic() - started, timed_out)
+        if tiers:
+            tiers.record("browser", bool(website))
+
+    await pipeline.submit(nom, website)
+
+def search_plan(args):
+    """Couples (secteur, ville) à chercher : `sectors` x `cities` pour un lot, sinon le couple `sector`/`city`.
+
+    LinkedIn ne cherche que par secteur : la ville est ignorée.
+    """
+    sectors = getattr(args, "sectors", None) or [args.sector]
+    cities = getattr(args, "cities", None) or [args.city]
+    if args.source != "maps":
+        cities = [None]
+    return list(dict.fromkeys(itertools.product(sectors, cities)))
+
+async def run_search(args, sector, city, browser_pool, client, on_result, processed_websites=None,
+                     policy=None, metrics=None, queue=None):
+    """Une recherche secteur/ville dans son propre contexte du pool. Retourne (flux trouvé, nombre de résultats)."""
+    search_query = f"{sector} {city}" if args.source == "maps" else sector
+    async with browser_pool.context(**CONTEXT_OPTIONS) as context:
+        if policy:
+            await policy.install(context)
+        page = await context.new_page()
+
+        workers = getattr(args, "workers", DEFAULT_WORKERS)
+        async with EnrichmentPipeline(client, args.limit, workers, on_result=on_result, store=CONTACT_STORE,
+                                      processed_websites=processed_websites, domain_filter=DOMAIN_FILTER) as pipeline:
+            if args.source == "maps" and getattr(args, "grid", 0) > 1:
+                feed_found = await discover_maps_sharded(
+                    page, browser_pool, search_query, city, pipeline, args.grid,
+                    getattr(args, "grid_parallel", DEFAULT_GRID_PARALLEL), getattr(args, "detail_tabs", 0),
+                    metrics, getattr(args, "capture_xhr", False), policy, queue,
+                )
+            elif args.source == "maps":
+                feed_found = await discover_maps(
+                    page, search_query, pipeline, getattr(args, "detail_tabs", 0), metrics,
+                    capture_xhr=getattr(args, "capture_xhr", False),
+                )
+            else:
+                feed_found = await discover_linkedin(
+                    page, search_query, pipeline, metrics, getattr(args, "linkedin_pages", DEFAULT_LINKEDIN_PAGES)
+                )
+    return feed_found, pipeline.found
+
+async def run_scraper(args, queue=None, browser_pool=None, http_pool=None):
+    """Lance une recherche, ou un lot secteurs x villes. Sans `browser_pool` ni `http_pool` (ligne de commande), navigateur et client HTTP sont créés pour l'occasion.
+
+    Les recherches d'un lot (au plus `batch_parallel` à la fois) partagent navigateurs, client HTTP,
+    fichier CSV et sites déjà traités : une entreprise trouvée par deux recherches n'est enrichie
+    et écrite qu'une fois. L'objectif `limit` s'applique à chaque recherche.
+    """
     handler = None
     if queue:
         handler = QueueLogger(queue)
@@ -131,212 +753,114 @@ async def run_scraper(args, queue=None):
         logger.addHandler(handler)
         logger.setLevel(logging.INFO)
 
+    sink = None
     try:
-        if args.source == "maps":
-            search_query = f"{args.sector} {args.city}"
+        combinations = search_plan(args)
+        batch = len(combinations) > 1
+        parallel = max(1, getattr(args, "batch_parallel", DEFAULT_BATCH_PARALLEL))
+        if batch:
+            logger.info(f"Démarrage d'un lot de {len(combinations)} recherches ({args.source}), {parallel} à la fois (Objectif: {args.limit} résultats par recherche)")
         else:
-            search_query = args.sector
-            
-        logger.info(f"Démarrage de la recherche ({args.source}) pour : '{search_query}' (Objectif: {args.limit} résultats)")
+            sector, city = combinations[0]
+            search_query = f"{sector} {city}" if args.source == "maps" else sector
+            logger.info(f"Démarrage de la recherche ({args.source}) pour : '{search_query}' (Objectif: {args.limit} résultats)")
 
         results = []
-        found_emails_count = 0
+        output_file = getattr(args, "output", None) or OUTPUT_FILE
+        sink = CsvResultSink(output_file)
+
+        def record_result(row):
+            source_label = "" if args.source == "maps" else " (via LinkedIn)"
+            logger.info(f"TROUVÉ{source_label}: {row['nom']} -> {row['email']} / {row['telephone']}")
+            results.append(row)
+            sink.write(row)
+
+            if queue:
+                queue.put_nowait({"type": "result", "data": row})
+
+        def report(index, sector, city, status, **data):
+            if queue and batch:
+                queue.put_nowait({"type": "combination", "data": {
+                    "index": index, "total": len(combinations), "sector": sector, "city": city, "status": status, **data,
+                }})
+
+        policy = None
+        if getattr(args, "block_resources", True):
+            policy = ResourcePolicy.for_source(args.source)
+        wait_metrics = WaitMetrics()
         processed_websites = set()
-        
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                viewport={'width': 1280, 'height': 800},
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-                locale="fr-FR"
-            )
-            page = await context.new_page()
-            
-            if args.source == "maps":
-                url = f"https://www.google.com/maps/search/{search_query.replace(' ', '+')}"
-                await page.goto(url)
-                await asyncio.sleep(4)
-                await handle_cookies(page)
-                
-                feed_selectors = ['div[role="feed"]', 'div[aria-label^="Résultats pour"]', 'div.m67q6026', 'div[role="main"]']
-                feed_selector = None
-                for selector in feed_selectors:
+        slots = asyncio.Semaphore(parallel)
+
+        # En ligne de commande, cache et contacts connus ne sont ouverts que le temps de la recherche
+        own_cache = not HTTP_CACHE.is_open
+        if own_cache:
+            HTTP_CACHE.open()
+        own_store = not CONTACT_STORE.is_open
+        if own_store:
+            CONTACT_STORE.open()
+        own_pool = browser_pool is None
+        if own_pool:
+            browser_pool = BrowserPool(max_browsers=1)
+            await browser_pool.start()
+        own_http_pool = http_pool is None
+        if own_http_pool:
+            http_pool = HttpClientPool()
+            await http_pool.start()
+        try:
+            client = http_pool.client
+
+            async def run_combination(index, sector, city):
+                async with slots:
+                    report(index, sector, city, "started")
                     try:
-                        await page.wait_for_selector(selector, timeout=8000)
-                        feed_selector = selector
-                        break
-                    except:
-                        continue
-                
-                if not feed_selector:
-                    logger.error("Impossible de trouver le flux de résultats.")
-                    await browser.close()
-                    return
+                        feed_found, found = await run_search(
+                            args, sector, city, browser_pool, client, record_result, processed_websites,
+                            policy, wait_metrics, queue,
+                        )
+                    except Exception as e:
+                        if not batch:
+                            raise
+                        logger.error(f"Recherche '{sector} {city or ''}' en échec : {e}")
+                        report(index, sector, city, "error", message=str(e))
+                        return False
+                    report(index, sector, city, "done", feed_found=feed_found, found=found, total_found=len(results))
+                    return feed_found
 
-                async with httpx.AsyncClient(http2=True, verify=False, follow_redirects=True, headers={"User-Agent": "Mozilla/5.0"}) as client:
-                    for iteration in range(20):
-                        if found_emails_count >= args.limit:
-                            break
-                        
-                        try:
-                            await page.locator(feed_selector).evaluate("el => el.scrollTop += 2000")
-                        except:
-                            await page.mouse.wheel(0, 2000)
-                        await asyncio.sleep(3)
-                        
-                        cards = await page.locator('div[role="article"]').all()
-                        for card in cards:
-                            if found_emails_count >= args.limit:
-                                break
-                            try:
-                                await card.click()
-                                await asyncio.sleep(2)
-                                
-                                nom_elem = page.locator('h1.DUwDvf')
-                                if await nom_elem.count() == 0: continue
-                                nom = await nom_elem.text_content()
-                                
-                                website_locator = page.locator('a[data-item-id="authority"]')
-                                website = ""
-                                if await website_locator.count() > 0:
-                                    website = await website_locator.get_attribute("href")
-                                
-                                if website and website not in processed_websites:
-                                    processed_websites.add(website)
-                                    contacts = await extract_contact_info_from_website(client, website)
-                                    if contacts["email"]:
-                                        logger.info(f"TROUVÉ: {nom} -> {contacts['email']} / {contacts['telephone']}")
-                                        results.append({"nom": nom, "website": website, "email": contacts["email"], "telephone": contacts["telephone"]})
-                                        found_emails_count += 1
-                                        
-                                        with open(OUTPUT_FILE, 'w', newline='', encoding='utf-8') as f:
-                                            writer = csv.DictWriter(f, fieldnames=["nom", "website", "email", "telephone"])
-                                            writer.writeheader()
-                                            writer.writerows(results)
-                                        
-                                        if queue:
-                                            queue.put_nowait({
-                                                "type": "result",
-                                                "data": {"nom": nom, "website": website, "email": contacts["email"], "telephone": contacts["telephone"]}
-                                            })
-                            except:
-                                continue
-            else:
-                # LinkedIn Source via DuckDuckGo HTML (httpx, pas de CAPTCHA)
-                from urllib.parse import unquote, urlparse, parse_qs
-                
-                query = f"linkedin company {search_query}"
-                ddg_url = f"https://html.duckduckgo.com/html/?q={query.replace(' ', '+')}"
-                logger.info(f"Recherche LinkedIn via DuckDuckGo HTML : '{query}'")
-                
-                linkedin_urls = []
-                try:
-                    ddg_response = httpx.get(ddg_url, headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}, follow_redirects=True, timeout=15)
-                    ddg_soup = BeautifulSoup(ddg_response.text, 'html.parser')
-                    
-                    for a_tag in ddg_soup.find_all('a', href=True):
-                        href = a_tag['href']
-                        # Extraire l'URL réelle depuis les redirections DDG
-                        if 'uddg=' in href:
-                            actual_url = unquote(href.split('uddg=')[1].split('&')[0])
-                        else:
-                            actual_url = href
-                        
-                        if 'linkedin.com/company/' in actual_url:
-                            title = a_tag.get_text(strip=True) or "Inconnu"
-                            if actual_url not in [u["url"] for u in linkedin_urls]:
-                                logger.info(f"LinkedIn Company trouvée : {title} -> {actual_url}")
-                                linkedin_urls.append({"url": actual_url, "title": title})
-                except Exception as e:
-                    logger.error(f"Erreur DuckDuckGo HTML : {e}")
-                
-                logger.info(f"{len(linkedin_urls)} pages LinkedIn Company trouvées.")
-                
-                async with httpx.AsyncClient(http2=True, verify=False, follow_redirects=True, headers={"User-Agent": "Mozilla/5.0"}) as client:
-                    for item in linkedin_urls:
-                        if found_emails_count >= args.limit:
-                            break
-                        
-                        href = item["url"]
-                        nom = item["title"].split(" |")[0].split(" -")[0].strip()  # Nettoyage du titre
-                        
-                        try:
-                            # Visite la page LinkedIn Company avec Playwright
-                            logger.info(f"Visite de la page LinkedIn : {href}")
-                            await page.goto(href, timeout=15000)
-                            await asyncio.sleep(3)
-                            
-                            # Extraction du nom depuis la page (plus fiable)
-                            nom_elem = page.locator('h1')
-                            if await nom_elem.count() > 0:
-                                page_nom = await nom_elem.first.text_content()
-                                if page_nom and page_nom.strip():
-                                    nom = page_nom.strip()
-                            
-                            # Extraction du site web depuis LinkedIn
-                            website = ""
-                            # Chercher les liens externes (pas linkedin.com)
-                            all_links = await page.locator('a[href^="http"]').all()
-                            for a_link in all_links:
-                                a_href = await a_link.get_attribute("href")
-                                if a_href and "linkedin.com" not in a_href and "microsoft.com" not in a_href:
-                                    a_text = await a_link.text_content() or ""
-                                    if any(kw in a_text.lower() for kw in ["site", "website", "visiter", "visit"]):
-                                        website = a_href
-                                        break
-                            
-                            # Si pas trouvé via le texte, chercher dans le HTML brut
-                            if not website:
-                                page_content = await page.content()
-                                # Chercher des URLs dans le contenu qui ne sont pas linkedin
-                                ext_urls = re.findall(r'https?://(?!.*linkedin\.com)[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(?:/[^\s"<]*)?', page_content)
-                                # Filtrer les URLs utiles
-                                for ext_url in ext_urls:
-                                    if any(d in ext_url for d in ["google.com", "microsoft.com", "facebook.com", "twitter.com", "youtube.com", "cdn.", "static."]):
-                                        continue
-                                    website = ext_url.split('"')[0].split("'")[0]
-                                    break
-                            
-                            if website:
-                                logger.info(f"Site web trouvé pour {nom} : {website}")
-                            else:
-                                logger.warning(f"Aucun site web trouvé pour {nom}")
-                            
-                            if website and website not in processed_websites:
-                                processed_websites.add(website)
-                                contacts = await extract_contact_info_from_website(client, website)
-                                if contacts["email"]:
-                                    logger.info(f"TROUVÉ (via LinkedIn): {nom} -> {contacts['email']} / {contacts['telephone']}")
-                                    results.append({"nom": nom, "website": website, "email": contacts["email"], "telephone": contacts["telephone"]})
-                                    found_emails_count += 1
-                                    
-                                    with open(OUTPUT_FILE, 'w', newline='', encoding='utf-8') as f:
-                                        writer = csv.DictWriter(f, fieldnames=["nom", "website", "email", "telephone"])
-                                        writer.writeheader()
-                                        writer.writerows(results)
-                                    
-                                    if queue:
-                                        queue.put_nowait({
-                                            "type": "result",
-                                            "data": {"nom": nom, "website": website, "email": contacts["email"], "telephone": contacts["telephone"]}
-                                        })
-                        except Exception as e:
-                            logger.warning(f"Erreur sur LinkedIn ({nom}): {e}")
-                            continue
-
-            await browser.close()
-            logger.info(f"Terminé. {found_emails_count} emails extraits dans {OUTPUT_FILE}.")
+            outcomes = await asyncio.gather(*(
+                run_combination(index, sector, city) for index, (sector, city) in enumerate(combinations)
+            ))
+        finally:
+            if own_http_pool:
+                await http_pool.stop()
+            if own_pool:
+                await browser_pool.stop()
+            if own_store:
+                CONTACT_STORE.close()
 
-            if queue:
-                queue.put_nowait({
-                    "type": "done", 
-                    "data": {"message": f"Terminé. {found_emails_count} emails extraits.", "total": found_emails_count}
-                })
+        sink.close()
+        if not any(outcomes):
+            return
+
+        found_emails_count = len(results)
+        logger.info(f"Terminé. {found_emails_count} emails extraits dans {output_file}.")
+        logger.info(f"Cache HTTP : {HTTP_CACHE.stats()} / Contacts connus : {CONTACT_STORE.stats()}")
+        logger.info(f"Connexions HTTP : {http_pool.stats()} / Domaines : {DOMAIN_FILTER.stats()}")
+        if policy:
+            logger.info(f"Requêtes navigateur : {policy.stats()}")
+        logger.info(f"Attentes navigateur : {wait_metrics.summary()}")
+
+        if queue:
+            queue.put_nowait({
+                "type": "done",
+                "data": {"message": f"Terminé. {found_emails_count} emails extraits.", "total": found_emails_count}
+            })
     except Exception as e:
         logger.error(f"Erreur fatale: {e}")
         if queue:
             queue.put_nowait({"type": "error", "data": {"message": str(e)}})
     finally:
+        if sink:
+            sink.close()
         if queue and handler:
             logger.removeHandler(handler)
 
@@ -344,7 +868,18 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Recherche d'entreprises locales et extraction d'emails via Google Maps.")
     parser.add_argument("--sector", default=DEFAULT_SECTOR, help=f"Secteur d'activité (défaut: {DEFAULT_SECTOR})")
     parser.add_argument("--city", default=DEFAULT_CITY, help=f"Ville de recherche (défaut: {DEFAULT_CITY})")
+    parser.add_argument("--sectors", nargs="+", help="Lot : plusieurs secteurs, croisés avec --cities (remplace --sector)")
+    parser.add_argument("--cities", nargs="+", help="Lot : plusieurs villes, croisées avec --sectors (remplace --city)")
+    parser.add_argument("--batch-parallel", type=int, default=DEFAULT_BATCH_PARALLEL, help=f"Recherches d'un lot menées en parallèle (défaut: {DEFAULT_BATCH_PARALLEL})")
     parser.add_argument("--limit", type=int, default=DEFAULT_GOAL, help=f"Nombre d'emails à trouver (défaut: {DEFAULT_GOAL})")
     parser.add_argument("--source", choices=["maps", "linkedin"], default="maps", help="Source de données (maps ou linkedin)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"Nombre de sites web visités en parallèle (défaut: {DEFAULT_WORKERS})")
+    parser.add_argument("--detail-tabs", type=int, default=0, help="Ouvrir les fiches Maps dans N onglets en parallèle (défaut: 0, clic dans le flux)")
+    parser.add_argument("--capture-xhr", action="store_true", help="Lire les fiches dans les réponses réseau de Maps, le clic ne servant qu'en secours")
+    parser.add_argument("--grid", type=int, default=0, help="Découper la ville en N x N recherches Maps pour dépasser le plafond d'environ 120 fiches (défaut: 0, recherche unique)")
+    parser.add_argument("--grid-parallel", type=int, default=DEFAULT_GRID_PARALLEL, help=f"Cases de la grille explorées en parallèle (défaut: {DEFAULT_GRID_PARALLEL})")
+    parser.add_argument("--linkedin-pages", type=int, default=DEFAULT_LINKEDIN_PAGES, help=f"Pages LinkedIn visitées en parallèle (défaut: {DEFAULT_LINKEDIN_PAGES})")
+    parser.add_argument("--no-block-resources", dest="block_resources", action="store_false", help="Laisser le navigateur charger images, polices, médias et trackers")
+    parser.add_argument("--output", default=OUTPUT_FILE, help=f"Fichier CSV de sortie (défaut: {OUTPUT_FILE})")
     args = parser.parse_args()
     asyncio.run(run_scraper(args))
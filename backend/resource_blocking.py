@@ -0,0 +1,85 @@
+import logging
+from collections import Counter
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# On ne lit que le texte du DOM et quelques href : le rendu visuel est inutile
+BLOCKED_RESOURCE_TYPES = ("image", "font", "media")
+
+TRACKER_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "connect.facebook.net",
+    "px.ads.linkedin.com",
+    "snap.licdn.com",
+    "bat.bing.com",
+    "hotjar.com",
+    "scorecardresearch.com",
+)
+
+# Politique par source ; `allowed_hosts` passe toujours, même pour un type bloqué
+SOURCE_POLICIES = {
+    "maps": {
+        "blocked_types": BLOCKED_RESOURCE_TYPES,
+        "blocked_hosts": TRACKER_HOSTS,
+        "allowed_hosts": ("consent.google.com",),
+    },
+    "linkedin": {
+        "blocked_types": BLOCKED_RESOURCE_TYPES + ("stylesheet",),
+        "blocked_hosts": TRACKER_HOSTS,
+        "allowed_hosts": (),
+    },
+}
+
+def _host_matches(host, domains):
+    return any(host == d or host.endswith("." + d) for d in domains)
+
+class ResourcePolicy:
+    """Filtre les requêtes d'un BrowserContext Playwright et compte les requêtes bloquées/autorisées."""
+
+    def __init__(self, blocked_types=BLOCKED_RESOURCE_TYPES, blocked_hosts=TRACKER_HOSTS, allowed_hosts=()):
+        self.blocked_types = set(blocked_types)
+        self.blocked_hosts = tuple(blocked_hosts)
+        self.allowed_hosts = tuple(allowed_hosts)
+        self.counters = {"allowed": 0, "blocked": 0}
+        self.blocked_by_reason = Counter()
+
+    @classmethod
+    def for_source(cls, source):
+        return cls(**SOURCE_POLICIES.get(source, SOURCE_POLICIES["maps"]))
+
+    def should_block(self, resource_type, url):
+        """Retourne la raison du blocage (type de ressource ou 'tracker'), ou None."""
+        host = (urlsplit(url).hostname or "").lower()
+        if _host_matches(host, self.allowed_hosts):
+            return None
+        if _host_matches(host, self.blocked_hosts):
+            return "tracker"
+        if resource_type in self.blocked_types:
+            return resource_type
+        return None
+
+    async def handle(self, route):
+        request = route.request
+        reason = self.should_block(request.resource_type, request.url)
+        try:
+            if reason:
+                self.counters["blocked"] += 1
+                self.blocked_by_reason[reason] += 1
+                await route.abort()
+            else:
+                self.counters["allowed"] += 1
+                await route.continue_()
+        except Exception as e:
+            # Page fermée entre-temps : la requête n'a plus d'importance
+            logger.debug(f"Route abandonnée ({request.url}): {e}")
+
+    async def install(self, context):
+        await context.route("**/*", self.handle)
+
+    def stats(self):
+        return {**self.counters, "blocked_by_reason": dict(self.blocked_by_reason)}
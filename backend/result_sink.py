@@ -0,0 +1,58 @@
+import csv
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+RESULT_FIELDS = ["nom", "website", "email", "telephone"]
+
+class CsvResultSink:
+    """Écrit les résultats en ajout, une ligne par entreprise trouvée.
+
+    Chaque ligne est flushée aussitôt (l'export en cours de tâche voit tout ce que le tableau
+    affiche) ; le fichier est synchronisé sur disque (fsync) tous les `checkpoint_every` lignes
+    et à la fermeture.
+    """
+
+    def __init__(self, path, fieldnames=RESULT_FIELDS, checkpoint_every=100):
+        self.path = path
+        self.checkpoint_every = checkpoint_every
+        self.rows_written = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'w', newline='', encoding='utf-8', buffering=64 * 1024)
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames, extrasaction='ignore')
+        self._writer.writeheader()
+        self.checkpoint()
+
+    def write(self, row):
+        self._writer.writerow(row)
+        self.rows_written += 1
+        if self.rows_written % self.checkpoint_every == 0:
+            self.checkpoint()
+        else:
+            self.flush()
+
+    def flush(self):
+        self._file.flush()
+
+    def checkpoint(self):
+        """Flush puis fsync : les lignes écrites survivent à un crash du process."""
+        self.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file.closed:
+            return
+        try:
+            self.checkpoint()
+        finally:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
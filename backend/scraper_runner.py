@@ -1,4 +1,5 @@
 import asyncio
+import os
 import uuid
 import logging
 from dataclasses import dataclass
@@ -6,7 +7,9 @@ from typing import Dict, Any, Optional
 import json
 
 # Import the existing scraper
-from maps_scraper import run_scraper
+from maps_scraper import run_scraper, DEFAULT_WORKERS, DEFAULT_GRID_PARALLEL, DEFAULT_BATCH_PARALLEL, DEFAULT_LINKEDIN_PAGES
+from browser_pool import BrowserPool
+from http_pool import HttpClientPool
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +20,15 @@ class ScraperTask:
     status: str
     queue: asyncio.Queue
     task: Optional[asyncio.Task] = None
+    output_file: Optional[str] = None
+
+# Un fichier CSV par tâche, servi par /api/scrape/results/{task_id}
+RESULTS_DIR = "results"
+
+# Navigateurs partagés par toutes les tâches, démarrés/arrêtés par le lifespan de main.py
+BROWSER_POOL = BrowserPool()
+# Client HTTP partagé : les connexions keep-alive servent d'une tâche à l'autre
+HTTP_POOL = HttpClientPool()
 
 # Store tasks in memory
 TASKS: Dict[str, ScraperTask] = {}
@@ -28,6 +40,16 @@ class Args:
         self.city = kwargs.get("city")
         self.limit = int(kwargs.get("limit", 10))
         self.source = kwargs.get("source", "maps")
+        self.workers = int(kwargs.get("workers") or DEFAULT_WORKERS)
+        self.output = kwargs.get("output")
+        self.detail_tabs = int(kwargs.get("detail_tabs") or 0)
+        self.capture_xhr = bool(kwargs.get("capture_xhr", False))
+        self.grid = int(kwargs.get("grid") or 0)
+        self.grid_parallel = int(kwargs.get("grid_parallel") or DEFAULT_GRID_PARALLEL)
+        self.sectors = list(kwargs.get("sectors") or [])
+        self.cities = list(kwargs.get("cities") or [])
+        self.batch_parallel = int(kwargs.get("batch_parallel") or DEFAULT_BATCH_PARALLEL)
+        self.linkedin_pages = int(kwargs.get("linkedin_pages") or DEFAULT_LINKEDIN_PAGES)
 
 async def start_scraping_task(params: dict):
     global CURRENT_TASK_ID
@@ -46,7 +68,8 @@ async def start_scraping_task(params: dict):
         id=task_id,
         params=params,
         status="running",
-        queue=queue
+        queue=queue,
+        output_file=os.path.join(RESULTS_DIR, f"{task_id}.csv")
     )
     TASKS[task_id] = scraper_task
     CURRENT_TASK_ID = task_id
@@ -54,8 +77,8 @@ async def start_scraping_task(params: dict):
     # Wrap in asyncio task
     async def task_wrapper():
         try:
-            args = Args(**params)
-            await run_scraper(args, queue)
+            args = Args(**params, output=scraper_task.output_file)
+            await run_scraper(args, queue, browser_pool=BROWSER_POOL, http_pool=HTTP_POOL)
             scraper_task.status = "completed"
         except asyncio.CancelledError:
             scraper_task.status = "stopped"
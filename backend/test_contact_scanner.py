@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from contact_scanner import (
+    EMAIL_PATTERN, PHONE_PATTERN, IncrementalScanner, normalize_email, normalize_phone, scan_contacts,
+)
+
+PIECES = [
+    "05 56 12 34 56", "contact@salon-exemple.fr", "foo@bar.com", "0612345678", "info@a.b.fr",
+    "+33 1 23 45 67 89", "logo@2x.png", "mail:", " tel: ", "<br>", " ", ".", "abc", "x" * 30,
+]
+
+def scanned(text):
+    result = {"email": None, "telephone": None}
+    scan_contacts(text, result)
+    return result
+
+def streamed(text, size, overlap=256):
+    result = {"email": None, "telephone": None}
+    scanner = IncrementalScanner(result, overlap)
+    for start in range(0, len(text), size):
+        if scanner.feed(text[start:start + size]):
+            return result
+    scanner.close()
+    return result
+
+def first_matches(text):
+    """Référence : deux recherches indépendantes sur tout le texte."""
+    email = EMAIL_PATTERN.search(text)
+    phone = PHONE_PATTERN.search(text)
+    return {
+        "email": normalize_email(email.group()) if email else None,
+        "telephone": normalize_phone(phone.group()) if phone else None,
+    }
+
+def random_texts(count, seed=7):
+    rnd = random.Random(seed)
+    for _ in range(count):
+        yield "".join(rnd.choice(PIECES) for _ in range(rnd.randint(1, 12)))
+
+def test_overlapping_email_and_phone_are_both_found():
+    assert scanned("0612345678info@a.b.fr") == {"email": "0612345678info@a.b.fr", "telephone": "0612345678"}
+
+def test_image_names_are_not_emails():
+    assert scanned("logo@2x.png contact@salon.fr")["email"] == "contact@salon.fr"
+
+@pytest.mark.parametrize("size", [1, 7, 16, 50])
+def test_stream_does_not_rescan_a_phone_number(size):
+    text = "05 56 12 34 56contact@salon-exemple.fr<br>" + "x" * 300 + "<br>mail:foo@bar.com"
+    assert streamed(text, size) == scanned(text)
+
+def test_single_pass_matches_separate_searches():
+    for text in random_texts(2000):
+        assert scanned(text) == first_matches(text), text
+
+def test_streamed_matches_whole_body():
+    for text in random_texts(500):
+        expected = scanned(text)
+        for size in range(1, 51, 7):
+            assert streamed(text, size) == expected, (text, size)
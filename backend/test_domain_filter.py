@@ -0,0 +1,111 @@
+import asyncio
+import socket
+
+import pytest
+
+import domain_filter
+from domain_filter import DomainFilter
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+class StubResolver:
+    """Résolveur de test : `answers[host]` est une liste d'adresses ou une exception à lever."""
+
+    def __init__(self, answers, delay=0.0):
+        self.answers = answers
+        self.delay = delay
+        self.calls = []
+
+    async def __call__(self, host):
+        self.calls.append(host)
+        await asyncio.sleep(self.delay)
+        answer = self.answers[host]
+        if isinstance(answer, BaseException):
+            raise answer
+        return answer
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(domain_filter, "time", clock)
+    return clock
+
+def nxdomain():
+    return socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+
+def test_nxdomain_is_cached_for_negative_ttl(clock):
+    resolver = StubResolver({"mort.fr": nxdomain()})
+    domains = DomainFilter(resolver, positive_ttl=10, negative_ttl=100)
+
+    async def scenario():
+        assert not await domains.exists("https://mort.fr/contact")
+        clock.now += 99
+        assert not await domains.exists("mort.fr")
+        assert len(resolver.calls) == 1
+        clock.now += 2
+        assert not await domains.exists("mort.fr")
+        assert len(resolver.calls) == 2
+
+    asyncio.run(scenario())
+    assert domains.stats()["nxdomain"] == 2
+    assert domains.stats()["negative_hits"] == 1
+
+def test_addresses_expire_after_positive_ttl(clock):
+    resolver = StubResolver({"vivant.fr": ["192.0.2.1"]})
+    domains = DomainFilter(resolver, positive_ttl=10, negative_ttl=100)
+
+    async def scenario():
+        assert await domains.resolve("https://vivant.fr/") == ["192.0.2.1"]
+        clock.now += 9
+        assert await domains.resolve("vivant.fr") == ["192.0.2.1"]
+        assert len(resolver.calls) == 1
+        clock.now += 2
+        assert await domains.exists("vivant.fr")
+        assert len(resolver.calls) == 2
+
+    asyncio.run(scenario())
+
+@pytest.mark.parametrize("error", [
+    socket.gaierror(socket.EAI_AGAIN, "Temporary failure in name resolution"),
+    UnicodeError("label too long"),
+])
+def test_temporary_errors_are_not_cached(clock, error):
+    resolver = StubResolver({"incertain.fr": error})
+    domains = DomainFilter(resolver)
+
+    async def scenario():
+        assert await domains.resolve("incertain.fr") is None
+        # Dans le doute, le site est tenté en HTTP
+        assert await domains.exists("incertain.fr")
+        assert len(resolver.calls) == 2
+
+    asyncio.run(scenario())
+    assert domains.stats()["entries"] == 0
+
+def test_timeout_is_not_cached():
+    resolver = StubResolver({"lent.fr": ["192.0.2.2"]}, delay=1.0)
+    domains = DomainFilter(resolver, timeout=0.01)
+
+    async def scenario():
+        assert await domains.resolve("lent.fr") is None
+        assert await domains.exists("lent.fr")
+        assert len(resolver.calls) == 2
+
+    asyncio.run(scenario())
+    assert domains.stats()["errors"] == 2
+
+def test_concurrent_resolves_share_one_lookup():
+    resolver = StubResolver({"partage.fr": ["192.0.2.3"]}, delay=0.05)
+    domains = DomainFilter(resolver)
+
+    async def scenario():
+        domains.prefetch("https://partage.fr/")
+        return await asyncio.gather(*(domains.resolve("partage.fr") for _ in range(5)))
+
+    assert asyncio.run(scenario()) == [["192.0.2.3"]] * 5
+    assert resolver.calls == ["partage.fr"]
@@ -0,0 +1,94 @@
+import asyncio
+import glob
+import json
+import os
+
+import pytest
+
+from contact_scanner import normalize_phone
+from maps_payload import MapsXhrCapture, parse_payload
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+FIXTURE = os.path.join(FIXTURES, "maps_search_payload.txt")
+# Payloads réels capturés par capture_maps_fixture.py, avec les cartes du flux lues dans le DOM
+CAPTURED = sorted(glob.glob(os.path.join(FIXTURES, "*.expected.json")))
+
+def load_fixture(path=FIXTURE):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+@pytest.mark.parametrize("expected_path", CAPTURED, ids=os.path.basename)
+def test_parse_payload_matches_captured_feed(expected_path):
+    records = {record["cid"]: record for record in parse_payload(load_fixture(expected_path.replace(".expected.json", ".txt")))}
+    with open(expected_path, encoding="utf-8") as f:
+        expected = json.load(f)
+    assert expected
+    for card in expected:
+        record = records.get(card["cid"])
+        assert record is not None, card
+        if card["name"]:
+            assert record["name"] == card["name"]
+        if card["website"]:
+            assert record["website"] == card["website"]
+        if card["telephone"]:
+            assert normalize_phone(record["telephone"] or "") == normalize_phone(card["telephone"])
+
+def test_parse_payload_reads_sample_payload():
+    # Échantillon écrit à la main : vérifie le décodage (enveloppe, préfixe, redirection /url?q=),
+    # pas les index du format réel, couverts par les payloads capturés
+
+    assert parse_payload(load_fixture()) == [
+        {
+            "name": "Salon Élégance",
+            "website": "https://www.salon-elegance.fr/",
+            "telephone": "05 56 12 34 56",
+            "cid": "0xd5527d8f1a2b3c4d:0x1a2b3c4d5e6f7081",
+        },
+        {
+            "name": "L'Atelier Coiffure",
+            "website": "https://latelier-coiffure.com/",
+            "telephone": "05 57 98 76 54",
+            "cid": "0xd5527d8f1a2b3c4e:0x2b3c4d5e6f708192",
+        },
+        {
+            "name": "Barber Chartrons",
+            "website": None,
+            "telephone": "06 12 34 56 78",
+            "cid": "0xd5527d8f1a2b3c4f:0x3c4d5e6f70819203",
+        },
+    ]
+
+def test_parse_payload_ignores_unreadable_body():
+    assert parse_payload("<html>erreur</html>") == []
+
+def test_knows_matches_on_name_only_without_cid():
+    capture = MapsXhrCapture(pipeline=None)
+    capture.seen_cids.add("0x1:0x2")
+    capture.seen_names.add("Salon Élégance")
+    assert capture.knows({"cid": "0x1:0x2", "name": "Autre nom"})
+    # Homonyme : un autre établissement du même nom n'est pas considéré comme lu
+    assert not capture.knows({"cid": "0x3:0x4", "name": "Salon Élégance"})
+    assert capture.knows({"cid": None, "name": "Salon Élégance"})
+    assert not capture.knows({"cid": None, "name": "Inconnu"})
+
+class RecordingPipeline:
+    def __init__(self):
+        self.submitted = []
+
+    async def submit(self, nom, website, telephone=None):
+        self.submitted.append((nom, website, telephone))
+        return True
+
+class FakeResponse:
+    url = "https://www.google.com/search?tbm=map&q=coiffeur"
+
+    async def text(self):
+        return load_fixture()
+
+def test_places_without_website_stay_clickable():
+    pipeline = RecordingPipeline()
+    capture = MapsXhrCapture(pipeline)
+    asyncio.run(capture._consume(FakeResponse()))
+    assert [nom for nom, _, _ in pipeline.submitted] == ["Salon Élégance", "L'Atelier Coiffure"]
+    assert not capture.knows({"cid": "0xd5527d8f1a2b3c4f:0x3c4d5e6f70819203", "name": "Barber Chartrons"})
+    assert capture.knows({"cid": "0xd5527d8f1a2b3c4d:0x1a2b3c4d5e6f7081", "name": "Salon Élégance"})
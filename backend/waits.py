@@ -0,0 +1,65 @@
+import time
+import logging
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+logger = logging.getLogger(__name__)
+
+CARD_SELECTOR = 'div[role="article"]'
+PLACE_TITLE_SELECTOR = 'h1.DUwDvf'
+
+class WaitMetrics:
+    """Durée des attentes conditionnelles d'une tâche, par type d'attente."""
+
+    def __init__(self):
+        self._stats = {}
+
+    def record(self, label, elapsed, timed_out):
+        stat = self._stats.setdefault(label, {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+        stat["count"] += 1
+        stat["total"] += elapsed
+        stat["max"] = max(stat["max"], elapsed)
+        stat["timeouts"] += int(timed_out)
+
+    def summary(self):
+        return {
+            label: {
+                "count": stat["count"],
+                "avg_ms": round(stat["total"] / stat["count"] * 1000),
+                "max_ms": round(stat["max"] * 1000),
+                "timeouts": stat["timeouts"],
+            }
+            for label, stat in self._stats.items()
+        }
+
+async def timed_wait(metrics, label, awaitable):
+    """Attend une condition Playwright (qui porte son propre timeout) et mesure sa durée.
+
+    Retourne False si le timeout est atteint : l'appelant continue comme après l'ancien sleep fixe.
+    """
+    started = time.monotonic()
+    timed_out = False
+    try:
+        await awaitable
+        return True
+    except PlaywrightTimeoutError:
+        timed_out = True
+        return False
+    finally:
+        if metrics:
+            metrics.record(label, time.monotonic() - started, timed_out)
+
+async def wait_for_card_growth(page, previous_count, metrics=None, timeout=3000):
+    """Après un scroll : attend que le flux Maps contienne plus de `previous_count` cartes."""
+    return await timed_wait(metrics, "maps_scroll", page.wait_for_function(
+        "([selector, n]) => document.querySelectorAll(selector).length > n",
+        arg=[CARD_SELECTOR, previous_count],
+        timeout=timeout,
+    ))
+
+async def wait_for_title_change(page, previous_title, metrics=None, timeout=3000):
+    """Après un clic sur une carte : attend que la fiche affichée porte un autre nom que `previous_title`."""
+    return await timed_wait(metrics, "maps_card", page.wait_for_function(
+        "([selector, previous]) => { const h = document.querySelector(selector); return !!h && h.textContent !== previous; }",
+        arg=[PLACE_TITLE_SELECTOR, previous_title],
+        timeout=timeout,
+    ))